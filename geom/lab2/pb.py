@@ -24,8 +24,9 @@ def print(*args, **kwargs):
     end = kwargs.get("end", "\n")
     text = sep.join(str(a) for a in args)
     if _log_file:
+        # Fara flush la fiecare apel: fisierul se goleste inainte de citiri (input)
+        # si la inchidere (atexit)
         _log_file.write(text + end)
-        _log_file.flush()
     builtins.print(*args, **kwargs)
 
 def input(prompt=""):
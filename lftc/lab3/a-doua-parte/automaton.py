@@ -1,7 +1,777 @@
-from typing import Dict, Optional, Set, Tuple
+import struct
+from array import array
+from functools import cached_property, lru_cache
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy este optional (folosit doar de Automaton.run_batch)
+    np = None
 
 EPSILON = "epsilon"
 
+# Simbol special: orice caracter fara tranzitie explicita din starea curenta
+OTHER = "other"
+
+# Buffer peste care se poate face potrivirea fara copiere (str, bytes sau memoryview)
+Buffer = Union[str, bytes, bytearray, memoryview]
+
+# Identificatorul starii capcana in tabelul compilat
+DEAD_STATE = 0
+
+
+def write_string(value: str) -> bytes:
+    """Serializeaza un sir: lungime u32 + octetii UTF-8"""
+    data = value.encode("utf-8")
+    return struct.pack("<I", len(data)) + data
+
+
+def read_string(buffer, offset: int) -> Tuple[str, int]:
+    """Citeste un sir scris cu write_string; intoarce (sir, offset nou)"""
+    (length,) = struct.unpack_from("<I", buffer, offset)
+    offset += 4
+    return bytes(buffer[offset : offset + length]).decode("utf-8"), offset + length
+
+
+def read_sequences(path: str) -> Iterator[str]:
+    """Citeste secventele dintr-un fisier, cate una pe linie, fara a-l incarca tot"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+class CompiledDFA:
+    """
+    Forma compilata a unui AFD: stari numerotate cu intregi, tabel dens de
+    tranzitii (stare x clasa de simboluri -> stare urmatoare) si bitmap de stari finale.
+    Starea 0 este starea capcana; toate tranzitiile lipsa duc in ea.
+    Simbolurile care se comporta identic in toate starile formeaza o singura
+    clasa; clasa 0 contine simbolul 'other' (caracterele din afara alfabetului).
+    """
+
+    def __init__(
+        self,
+        state_names: List[str],
+        alphabet: List[str],
+        symbol_class: Dict[Union[str, int], int],
+        num_classes: int,
+        table: Union[array, memoryview],
+        finals: bytearray,
+        start: int,
+        tags: Optional[List[Optional[str]]] = None,
+    ):
+        self.state_names = state_names
+        self.alphabet = alphabet
+        self.symbol_class = symbol_class
+        self.num_classes = num_classes
+        self.table = table
+        self.finals = finals
+        self.start = start
+        self.tags = tags if tags is not None else [None] * len(state_names)
+        self._numpy_tables = None
+
+    def numpy_tables(self):
+        """
+        (tabel stari x clase, clasa fiecarui octet 0..255, masca starilor finale)
+        ca array-uri NumPy, construite o singura data
+        """
+        if self._numpy_tables is None:
+            table = np.asarray(self.table, dtype=np.int32).reshape(-1, self.num_classes)
+            byte_classes = np.array(
+                [self.symbol_class.get(code, 0) for code in range(256)], dtype=np.int32
+            )
+            finals = np.frombuffer(bytes(self.finals), dtype=np.uint8).astype(bool)
+            self._numpy_tables = (table, byte_classes, finals)
+        return self._numpy_tables
+
+    def run_batch(self, matrix: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Parcurge simultan toate randurile unei matrice de coduri de caractere
+        (n secvente x lungime), cate o coloana pe pas. Intoarce masca de
+        acceptare si lungimile celor mai lungi prefixe acceptate.
+        """
+        table, byte_classes, finals = self.numpy_tables()
+        count, length = matrix.shape
+        if matrix.dtype == np.uint8:
+            classes = byte_classes[matrix]
+        else:
+            classes = np.zeros(matrix.shape, dtype=np.int32)
+            low = matrix < 256
+            classes[low] = byte_classes[matrix[low]]
+            for code in np.unique(matrix[~low]):
+                classes[matrix == code] = self.symbol_class.get(chr(code), 0)
+
+        # Tabel liniarizat si coloanele matricei de clase memorate contiguu
+        flat = table.ravel()
+        columns = np.ascontiguousarray(classes.T)
+        width = self.num_classes
+        state = np.full(count, self.start, dtype=np.int32)
+        lengths = np.zeros(count, dtype=np.int64)
+        for column in range(length):
+            state = flat[state * width + columns[column]]
+            np.copyto(lengths, column + 1, where=finals[state])
+            if not state.any():
+                break
+        return finals[state], lengths
+
+    @classmethod
+    def from_automaton(cls, automaton: "Automaton") -> "CompiledDFA":
+        """Construieste tabelul dens pentru un automat determinist"""
+        if not automaton.deterministic:
+            raise ValueError("Automatul nu este determinist.")
+
+        state_names = [""] + sorted(automaton.states)
+        state_ids = {name: idx for idx, name in enumerate(state_names) if idx}
+
+        # Coloana fiecarui simbol: destinatia din fiecare stare. Tranzitiile
+        # 'other' completeaza intreaga linie, apoi cele explicite le suprascriu.
+        other_column = [DEAD_STATE] * len(state_names)
+        for (src, sym), dests in automaton.transitions.items():
+            if sym == OTHER:
+                other_column[state_ids[src]] = state_ids[next(iter(dests))]
+        columns: Dict[str, List[int]] = {}
+        for (src, sym), dests in automaton.transitions.items():
+            if sym not in automaton.alphabet:
+                continue
+            column = columns.get(sym)
+            if column is None:
+                column = columns[sym] = list(other_column)
+            column[state_ids[src]] = state_ids[next(iter(dests))]
+
+        # Clase de echivalenta: simbolurile cu aceeasi coloana impart o clasa.
+        # Simbolurile care se comporta ca 'other' raman in clasa 0 si nu apar
+        # in dictionar. Pentru bytes/memoryview indexam si dupa codul octetului.
+        class_of_column: Dict[Tuple[int, ...], int] = {tuple(other_column): 0}
+        class_columns = [other_column]
+        symbol_class: Dict[Union[str, int], int] = {}
+        for sym in sorted(columns):
+            key = tuple(columns[sym])
+            sym_class = class_of_column.get(key)
+            if sym_class is None:
+                sym_class = class_of_column[key] = len(class_columns)
+                class_columns.append(columns[sym])
+            if sym_class == 0:
+                continue
+            symbol_class[sym] = sym_class
+            if len(sym) == 1 and ord(sym) < 256:
+                symbol_class[ord(sym)] = sym_class
+        num_classes = len(class_columns)
+
+        table = array("i", [DEAD_STATE]) * (len(state_names) * num_classes)
+        for sym_class, column in enumerate(class_columns):
+            for state, dest in enumerate(column):
+                table[state * num_classes + sym_class] = dest
+
+        finals = bytearray(len(state_names))
+        for name in automaton.final_states:
+            finals[state_ids[name]] = 1
+
+        tags: List[Optional[str]] = [None] * len(state_names)
+        for name, tag in automaton.tags.items():
+            tags[state_ids[name]] = tag
+
+        return cls(
+            state_names,
+            sorted(automaton.alphabet),
+            symbol_class,
+            num_classes,
+            table,
+            finals,
+            state_ids[automaton.initial_state],
+            tags,
+        )
+
+    def to_bytes(self, offset: int = 0) -> bytes:
+        """
+        Serializeaza forma compilata. 'offset' este pozitia la care vor fi scrisi
+        octetii in fisier, folosita pentru a alinia tabelul la 4 octeti.
+        """
+        num_states = len(self.state_names)
+        parts = [struct.pack("<III", num_states, self.num_classes, self.start)]
+        parts.extend(write_string(name) for name in self.state_names)
+        parts.extend(write_string(tag or "") for tag in self.tags)
+        parts.append(struct.pack("<I", len(self.alphabet)))
+        parts.extend(write_string(sym) for sym in self.alphabet)
+        symbols = sorted(sym for sym in self.symbol_class if isinstance(sym, str))
+        parts.append(struct.pack("<I", len(symbols)))
+        for sym in symbols:
+            parts.append(write_string(sym) + struct.pack("<I", self.symbol_class[sym]))
+        parts.append(bytes(self.finals))
+        size = offset + sum(len(part) for part in parts)
+        parts.append(b"\0" * (-size % 4))
+        parts.append(array("i", self.table).tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_buffer(cls, buffer, offset: int = 0) -> Tuple["CompiledDFA", int]:
+        """
+        Reconstruieste forma compilata din octetii scrisi cu to_bytes. Tabelul
+        ramane o vedere (memoryview) asupra bufferului, fara copiere.
+        Starea initiala, clasele si destinatiile din tabel sunt verificate, deci
+        date corupte dau ValueError, nu un automat care esueaza la folosire.
+        Intoarce (automat compilat, offset dupa date).
+        """
+        num_states, num_classes, start = struct.unpack_from("<III", buffer, offset)
+        offset += 12
+        state_names = []
+        for _ in range(num_states):
+            name, offset = read_string(buffer, offset)
+            state_names.append(name)
+        tags: List[Optional[str]] = []
+        for _ in range(num_states):
+            tag, offset = read_string(buffer, offset)
+            tags.append(tag or None)
+        (count,) = struct.unpack_from("<I", buffer, offset)
+        offset += 4
+        alphabet = []
+        for _ in range(count):
+            sym, offset = read_string(buffer, offset)
+            alphabet.append(sym)
+        (count,) = struct.unpack_from("<I", buffer, offset)
+        offset += 4
+        symbol_class: Dict[Union[str, int], int] = {}
+        for _ in range(count):
+            sym, offset = read_string(buffer, offset)
+            (sym_class,) = struct.unpack_from("<I", buffer, offset)
+            offset += 4
+            symbol_class[sym] = sym_class
+            if len(sym) == 1 and ord(sym) < 256:
+                symbol_class[ord(sym)] = sym_class
+        finals = bytearray(buffer[offset : offset + num_states])
+        offset += num_states
+        offset += -offset % 4
+        size = num_states * num_classes * 4
+        if len(finals) != num_states or offset + size > len(buffer):
+            raise ValueError("Date incomplete pentru automatul compilat.")
+        table = memoryview(buffer)[offset : offset + size].cast("i")
+        offset += size
+        if (
+            not 0 < start < num_states
+            or any(
+                not 0 < sym_class < num_classes for sym_class in symbol_class.values()
+            )
+            or (size and not 0 <= min(table) <= max(table) < num_states)
+        ):
+            raise ValueError("Date invalide pentru automatul compilat.")
+        compiled = cls(
+            state_names, alphabet, symbol_class, num_classes, table, finals, start, tags
+        )
+        return compiled, offset
+
+    def step(self, state: int, ch: Union[str, int]) -> int:
+        """Starea in care se ajunge din 'state' pe caracterul 'ch'"""
+        return self.table[state * self.num_classes + self.symbol_class.get(ch, 0)]
+
+    def accepts(self, sequence: Buffer) -> bool:
+        table = self.table
+        width = self.num_classes
+        classes = self.symbol_class
+        state = self.start
+        for ch in sequence:
+            state = table[state * width + classes.get(ch, 0)]
+            if state == DEAD_STATE:
+                return False
+        return self.finals[state] == 1
+
+    def longest_match(self, text: Buffer, start: int = 0) -> Tuple[int, int]:
+        """
+        Intoarce (lungime, stare finala) pentru cel mai lung prefix acceptat
+        care incepe la 'start'; (0, DEAD_STATE) daca nu exista.
+        """
+        table = self.table
+        width = self.num_classes
+        classes = self.symbol_class
+        finals = self.finals
+        state = self.start
+        last_accept = 0
+        last_state = DEAD_STATE
+        for pos in range(start, len(text)):
+            state = table[state * width + classes.get(text[pos], 0)]
+            if state == DEAD_STATE:
+                break
+            if finals[state]:
+                last_accept = pos + 1 - start
+                last_state = state
+        return last_accept, last_state
+
+    def scan(self, text: Buffer, start: int = 0) -> Tuple[int, int, int]:
+        """
+        Ca longest_match, dar intoarce si pozitia caracterului pe care automatul
+        s-a oprit (ultimul caracter citit), sau len(text) daca textul s-a terminat
+        cu automatul inca activ: atunci potrivirea ar putea continua cu date
+        suplimentare (analiza pe bucati, reanaliza incrementala).
+        """
+        table = self.table
+        width = self.num_classes
+        classes = self.symbol_class
+        finals = self.finals
+        state = self.start
+        last_accept = 0
+        last_state = DEAD_STATE
+        for pos in range(start, len(text)):
+            state = table[state * width + classes.get(text[pos], 0)]
+            if state == DEAD_STATE:
+                return last_accept, last_state, pos
+            if finals[state]:
+                last_accept = pos + 1 - start
+                last_state = state
+        return last_accept, last_state, len(text)
+
+    def advance(
+        self, text: Buffer, pos: int, state: int, end: int
+    ) -> Tuple[int, int, int, int]:
+        """
+        Continua o parcurgere din starea 'state', de la 'pos' pana la 'end'
+        (pentru texte citite pe bucati). Intoarce (starea curenta, pozitia de
+        dupa ultima acceptare sau -1, starea acceptata, pozitia de oprire);
+        starea curenta este DEAD_STATE daca automatul s-a oprit pe text[oprire].
+        """
+        table = self.table
+        width = self.num_classes
+        classes = self.symbol_class
+        finals = self.finals
+        last_accept = -1
+        last_state = DEAD_STATE
+        for pos in range(pos, end):
+            state = table[state * width + classes.get(text[pos], 0)]
+            if state == DEAD_STATE:
+                return state, last_accept, last_state, pos
+            if finals[state]:
+                last_accept = pos + 1
+                last_state = state
+        return state, last_accept, last_state, end
+
+    def match_length(self, text: Buffer, start: int = 0) -> int:
+        return self.longest_match(text, start)[0]
+
+
+class CompiledNFA:
+    """
+    Simulator pentru AFN: multimile de stari sunt reprezentate ca bitset-uri
+    (int), iar inchiderile epsilon sunt precalculate pentru fiecare stare.
+    Tranzitiile pe fiecare simbol duc direct in multimea deja inchisa.
+    """
+
+    def __init__(self, automaton: "Automaton"):
+        names = sorted(automaton.states)
+        ids = {name: idx for idx, name in enumerate(names)}
+        self.state_names = names
+
+        # Inchiderea epsilon a fiecarei stari (ca bitset)
+        closure = [0] * len(names)
+        for name, idx in ids.items():
+            mask = 0
+            stack = [name]
+            seen = {name}
+            while stack:
+                state = stack.pop()
+                mask |= 1 << ids[state]
+                for dest in automaton.transitions.get((state, EPSILON), ()):
+                    if dest not in seen:
+                        seen.add(dest)
+                        stack.append(dest)
+            closure[idx] = mask
+        self.closure = closure
+
+        # moves[simbol][stare] = inchiderea multimii destinatiilor
+        self.moves: Dict[Union[str, int], List[int]] = {}
+        self.other_moves = [0] * len(names)
+        for (src, sym), dests in automaton.transitions.items():
+            if sym == EPSILON:
+                continue
+            target = self.close(sum(1 << ids[d] for d in dests))
+            if sym == OTHER:
+                self.other_moves[ids[src]] = target
+                continue
+            row = self.moves.get(sym)
+            if row is None:
+                row = self.moves[sym] = [0] * len(names)
+                if len(sym) == 1 and ord(sym) < 256:
+                    self.moves[ord(sym)] = row
+            row[ids[src]] = target
+
+        self.start = closure[ids[automaton.initial_state]]
+        self.finals = sum(1 << ids[name] for name in automaton.final_states)
+        # Pasii deja calculati: (multime, simbol) -> multime
+        self._cache: Dict[Tuple[int, Union[str, int]], int] = {}
+
+    def close(self, mask: int) -> int:
+        """Inchiderea epsilon a unei multimi de stari"""
+        result = 0
+        while mask:
+            low = mask & -mask
+            result |= self.closure[low.bit_length() - 1]
+            mask ^= low
+        return result
+
+    def step(self, current: int, ch: Union[str, int]) -> int:
+        """Multimea de stari (inchisa) in care se ajunge din 'current' pe 'ch'"""
+        key = (current, ch)
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+        row = self.moves.get(ch)
+        other = self.other_moves
+        result = 0
+        mask = current
+        while mask:
+            low = mask & -mask
+            idx = low.bit_length() - 1
+            # Tranzitia explicita are prioritate fata de 'other'
+            result |= (row[idx] if row is not None else 0) or other[idx]
+            mask ^= low
+        self._cache[key] = result
+        return result
+
+    def accepts(self, sequence: Buffer) -> bool:
+        current = self.start
+        for ch in sequence:
+            current = self.step(current, ch)
+            if not current:
+                return False
+        return bool(current & self.finals)
+
+    def longest_match(self, text: Buffer, start: int = 0) -> Tuple[int, int]:
+        """
+        Intoarce (lungime, multimea de stari) pentru cel mai lung prefix acceptat
+        care incepe la 'start'; (0, 0) daca nu exista.
+        """
+        current = self.start
+        finals = self.finals
+        last_accept = 0
+        last_states = 0
+        for pos in range(start, len(text)):
+            current = self.step(current, text[pos])
+            if not current:
+                break
+            if current & finals:
+                last_accept = pos + 1 - start
+                last_states = current
+        return last_accept, last_states
+
+    def match_length(self, text: Buffer, start: int = 0) -> int:
+        return self.longest_match(text, start)[0]
+
+
+class LazyDFA:
+    """
+    AFD construit la cerere, rezultatul operatiilor pe automate (|, &, -, ~, +,
+    star). Starile sunt chei (de ex. perechi de stari ale operanzilor) care
+    primesc un numar abia cand sunt vizitate, iar fiecare tranzitie
+    (stare, simbol) se calculeaza o singura data si se memoreaza.
+    Caracterele din afara alfabetului se comporta ca 'other'.
+    """
+
+    def __init__(
+        self,
+        alphabet: Iterable[str],
+        start: Hashable,
+        step: Callable[[Hashable, str], Hashable],
+        is_final: Callable[[Hashable], bool],
+        is_dead: Callable[[Hashable], bool],
+    ):
+        self.alphabet = frozenset(alphabet)
+        self._step_key = step
+        self._final_key = is_final
+        self._dead_key = is_dead
+        self._keys: List[Hashable] = []
+        self._ids: Dict[Hashable, int] = {}
+        self._transitions: Dict[Tuple[int, str], int] = {}
+        # finals[stare] / dead[stare]: starea accepta / nu mai poate ajunge
+        # intr-o stare finala (estimare sigura: o stare marcata vie poate fi moarta)
+        self.finals = bytearray()
+        self.dead = bytearray()
+        self.start = self._intern(start)
+
+    @classmethod
+    def from_automaton(cls, automaton: Union["Automaton", "LazyDFA"]) -> "LazyDFA":
+        """Operandul unei operatii: AFD-ul compilat sau simulatorul AFN-ului"""
+        if isinstance(automaton, LazyDFA):
+            return automaton
+        matcher = automaton._matcher()
+        if isinstance(matcher, CompiledDFA):
+            finals = matcher.finals
+            return cls(
+                automaton.alphabet,
+                matcher.start,
+                matcher.step,
+                lambda state: finals[state],
+                lambda state: state == DEAD_STATE,
+            )
+        final_mask = matcher.finals
+        return cls(
+            automaton.alphabet,
+            matcher.start,
+            matcher.step,
+            lambda mask: mask & final_mask,
+            lambda mask: not mask,
+        )
+
+    def __len__(self) -> int:
+        """Numarul de stari construite pana acum"""
+        return len(self._keys)
+
+    def _intern(self, key: Hashable) -> int:
+        state = self._ids.get(key)
+        if state is None:
+            state = self._ids[key] = len(self._keys)
+            self._keys.append(key)
+            self.finals.append(1 if self._final_key(key) else 0)
+            self.dead.append(1 if self._dead_key(key) else 0)
+        return state
+
+    def step(self, state: int, ch: str) -> int:
+        """Starea in care se ajunge din 'state' pe 'ch' (construita la nevoie)"""
+        if ch not in self.alphabet:
+            ch = OTHER
+        target = self._transitions.get((state, ch))
+        if target is None:
+            target = self._intern(self._step_key(self._keys[state], ch))
+            self._transitions[(state, ch)] = target
+        return target
+
+    # Operatii: operandul poate fi Automaton sau LazyDFA; niciuna nu construieste
+    # stari inainte de prima potrivire (sau de to_automaton)
+    def _product(
+        self,
+        other: Union["Automaton", "LazyDFA"],
+        final: Callable[[int, int], bool],
+        dead: Callable[[int, int], bool],
+    ) -> "LazyDFA":
+        left, right = self, LazyDFA.from_automaton(other)
+        return LazyDFA(
+            left.alphabet | right.alphabet,
+            (left.start, right.start),
+            lambda key, ch: (left.step(key[0], ch), right.step(key[1], ch)),
+            lambda key: final(left.finals[key[0]], right.finals[key[1]]),
+            lambda key: dead(left.dead[key[0]], right.dead[key[1]]),
+        )
+
+    def union(self, other: Union["Automaton", "LazyDFA"]) -> "LazyDFA":
+        return self._product(other, lambda a, b: a or b, lambda a, b: a and b)
+
+    def intersection(self, other: Union["Automaton", "LazyDFA"]) -> "LazyDFA":
+        return self._product(other, lambda a, b: a and b, lambda a, b: a or b)
+
+    def difference(self, other: Union["Automaton", "LazyDFA"]) -> "LazyDFA":
+        return self._product(other, lambda a, b: a and not b, lambda a, b: a)
+
+    def complement(self) -> "LazyDFA":
+        """Toate secventele (peste orice caractere) pe care automatul le respinge"""
+        finals = self.finals
+        return LazyDFA(
+            self.alphabet,
+            self.start,
+            self.step,
+            lambda state: not finals[state],
+            lambda _: False,
+        )
+
+    def concatenation(self, other: Union["Automaton", "LazyDFA"]) -> "LazyDFA":
+        """
+        Starea este (stare din primul automat, multimea starilor active din al
+        doilea); al doilea porneste de fiecare data cand primul accepta.
+        """
+        left, right = self, LazyDFA.from_automaton(other)
+
+        def key_of(state: int, active: Iterable[int]) -> Tuple[int, frozenset]:
+            active = {item for item in active if not right.dead[item]}
+            if left.finals[state] and not right.dead[right.start]:
+                active.add(right.start)
+            return state, frozenset(active)
+
+        return LazyDFA(
+            left.alphabet | right.alphabet,
+            key_of(left.start, ()),
+            lambda key, ch: key_of(
+                left.step(key[0], ch), (right.step(item, ch) for item in key[1])
+            ),
+            lambda key: any(right.finals[item] for item in key[1]),
+            lambda key: left.dead[key[0]] and not key[1],
+        )
+
+    def star(self) -> "LazyDFA":
+        """
+        Inchiderea Kleene. Starea este (multimea starilor active, inceput): o
+        noua repetare porneste din starea initiala ori de cate ori una activa accepta.
+        """
+        inner = self
+
+        def key_of(active: Iterable[int]) -> Tuple[frozenset, bool]:
+            active = {item for item in active if not inner.dead[item]}
+            if any(inner.finals[item] for item in active):
+                active.add(inner.start)
+            return frozenset(active), False
+
+        return LazyDFA(
+            self.alphabet,
+            (frozenset([inner.start]), True),
+            lambda key, ch: key_of(inner.step(item, ch) for item in key[0]),
+            lambda key: key[1] or any(inner.finals[item] for item in key[0]),
+            lambda key: not key[0] and not key[1],
+        )
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __add__ = concatenation
+
+    def __invert__(self) -> "LazyDFA":
+        return self.complement()
+
+    def accepts(self, sequence: str) -> bool:
+        state = self.start
+        for ch in sequence:
+            state = self.step(state, ch)
+            if self.dead[state]:
+                return False
+        return self.finals[state] == 1
+
+    def match_length(self, text: str, start: int = 0) -> int:
+        """Lungimea celui mai lung prefix acceptat care incepe la 'start'"""
+        state = self.start
+        last_accept = 0
+        for pos in range(start, len(text)):
+            state = self.step(state, text[pos])
+            if self.dead[state]:
+                break
+            if self.finals[state]:
+                last_accept = pos + 1 - start
+        return last_accept
+
+    def longest_accepted_prefix(self, sequence: str) -> str:
+        return sequence[: self.match_length(sequence)]
+
+    def distinguishing_word(
+        self, other: Union["Automaton", "LazyDFA"]
+    ) -> Optional[str]:
+        """
+        O secventa acceptata de exact unul dintre automate, sau None daca sunt
+        echivalente (algoritmul Hopcroft-Karp). Perechile de stari sunt parcurse
+        in latime pornind din starile initiale; cele deja unite intr-o clasa
+        (union-find) nu se mai exploreaza. Prima pereche cu o stare finala si una
+        nefinala opreste cautarea, iar drumul pana la ea este contraexemplul.
+        """
+        left, right = self, LazyDFA.from_automaton(other)
+        alphabet = left.alphabet | right.alphabet
+        symbols = sorted(alphabet) + [OTHER]
+
+        parent: Dict[Tuple[int, int], Tuple[int, int]] = {}
+
+        def find(item: Tuple[int, int]) -> Tuple[int, int]:
+            root = item
+            while root in parent:
+                root = parent[root]
+            while item != root:
+                parent[item], item = root, parent[item]
+            return root
+
+        # Perechile vizitate: (stare stanga, stare dreapta, perechea precedenta, simbol)
+        pairs: List[Tuple[int, int, int, str]] = [(left.start, right.start, -1, "")]
+        parent[(1, right.start)] = (0, left.start)
+        head = 0
+        while head < len(pairs):
+            p, q, _, _ = pairs[head]
+            if left.finals[p] != right.finals[q]:
+                return self._word_to(pairs, head, alphabet)
+            for sym in symbols:
+                next_p = left.step(p, sym)
+                next_q = right.step(q, sym)
+                root_p = find((0, next_p))
+                root_q = find((1, next_q))
+                if root_p != root_q:
+                    parent[root_q] = root_p
+                    pairs.append((next_p, next_q, head, sym))
+            head += 1
+        return None
+
+    @staticmethod
+    def _word_to(
+        pairs: List[Tuple[int, int, int, str]], index: int, alphabet: Iterable[str]
+    ) -> str:
+        """Secventa care duce in perechea 'index' ('other' devine un caracter nou)"""
+        alphabet = set(alphabet)
+        code = ord("!")
+        while chr(code) in alphabet:
+            code += 1
+        outside = chr(code)
+
+        symbols = []
+        while pairs[index][2] >= 0:
+            sym = pairs[index][3]
+            symbols.append(outside if sym == OTHER else sym)
+            index = pairs[index][2]
+        return "".join(reversed(symbols))
+
+    def equivalent(self, other: Union["Automaton", "LazyDFA"]) -> bool:
+        """Automatele accepta acelasi limbaj"""
+        return self.distinguishing_word(other) is None
+
+    def subset_counterexample(
+        self, other: Union["Automaton", "LazyDFA"]
+    ) -> Optional[str]:
+        """O secventa acceptata de acest automat si respinsa de 'other', sau None"""
+        # L(a) inclus in L(b) <=> L(a) U L(b) = L(b)
+        return self.union(other).distinguishing_word(other)
+
+    def is_subset(self, other: Union["Automaton", "LazyDFA"]) -> bool:
+        """Limbajul automatului este inclus in limbajul lui 'other'"""
+        return self.subset_counterexample(other) is None
+
+    def to_automaton(self) -> "Automaton":
+        """
+        Construieste explicit partea accesibila (si vie) a automatului, ca AFD
+        cu starile p0, p1, ... (numerotarea interna); se poate apoi minimiza.
+        """
+        symbols = sorted(self.alphabet)
+        if self.dead[self.start]:
+            return Automaton({"p0"}, set(symbols), {}, "p0", set())
+
+        states: Set[str] = set()
+        transitions: Dict[Tuple[str, str], Set[str]] = {}
+        finals: Set[str] = set()
+        sink = "pDead"
+        queue = [self.start]
+        seen = {self.start}
+        while queue:
+            state = queue.pop()
+            src = f"p{state}"
+            states.add(src)
+            if self.finals[state]:
+                finals.add(src)
+            other_next = self.step(state, OTHER)
+            moves = [(OTHER, other_next)]
+            for sym in symbols:
+                nxt = self.step(state, sym)
+                if nxt != other_next:
+                    moves.append((sym, nxt))
+            for sym, nxt in moves:
+                if self.dead[nxt]:
+                    # Un simbol care duce in capcana cand 'other' nu o face are
+                    # nevoie de o stare capcana reala
+                    if sym != OTHER and not self.dead[other_next]:
+                        states.add(sink)
+                        transitions[(src, sym)] = {sink}
+                    continue
+                if nxt not in seen:
+                    seen.add(nxt)
+                    queue.append(nxt)
+                transitions[(src, sym)] = {f"p{nxt}"}
+
+        return Automaton(states, set(symbols), transitions, f"p{self.start}", finals)
+
 
 class Automaton:
     def __init__(
@@ -11,6 +781,7 @@ class Automaton:
         transitions: Dict[Tuple[str, str], Set[str]],
         initial_state: str,
         final_states: Set[str],
+        tags: Optional[Dict[str, str]] = None,
     ):
         self.states = set(states)
         self.alphabet = set(alphabet)
@@ -20,6 +791,10 @@ class Automaton:
             self.transitions[(src, sym)] = set(dests)
         self.initial_state = initial_state
         self.final_states = set(final_states)
+        # Eticheta (clasa de token) pentru starile finale ale automatelor combinate
+        self.tags: Dict[str, str] = dict(tags) if tags else {}
+        self._compiled: Optional[CompiledDFA] = None
+        self._simulator: Optional[CompiledNFA] = None
 
         # Basic validation
         if self.initial_state not in self.states:
@@ -179,7 +954,7 @@ class Automaton:
                     raise ValueError(
                         f"Starea destinatie '{dest}' nu exista in 'states'"
                     )
-            if sym != EPSILON and sym not in alphabet:
+            if sym not in (EPSILON, OTHER) and sym not in alphabet:
                 raise ValueError(f"Simbolul '{sym}' nu exista in alfabet.")
 
         return cls(states, alphabet, transitions, initial, final_states)
@@ -204,7 +979,9 @@ class Automaton:
         )
         alpha_in = input("> ").strip()
         alphabet = set(
-            s.strip() for s in alpha_in.split(",") if s.strip() and s.strip() != EPSILON
+            s.strip()
+            for s in alpha_in.split(",")
+            if s.strip() and s.strip() not in (EPSILON, OTHER)
         )
 
         print("Introduceti starea initiala:")
@@ -228,25 +1005,172 @@ class Automaton:
 
         transitions: Dict[Tuple[str, str], Set[str]] = {}
         print(
-            "Introduceti fiecare tranzitie pe o linie: <sursa> <simbol|epsilon> <destinatie>"
+            "Introduceti fiecare tranzitie pe o linie: "
+            "<sursa> <simbol|epsilon|other> <destinatie>"
         )
         for i in range(n):
             line = input(f"t{i + 1}> ").strip()
             parts = line.split()
             if len(parts) != 3:
                 raise ValueError(
-                    "Format tranzitie invalid. Asteptat: <sursa> <simbol|epsilon> <destinatie>"
+                    "Format tranzitie invalid. "
+                    "Asteptat: <sursa> <simbol|epsilon|other> <destinatie>"
                 )
             src, sym, dest = parts
             if src not in states or dest not in states:
                 raise ValueError("Stari necunoscute in tranzitie.")
-            if sym != EPSILON and (len(sym) != 1 or sym not in alphabet):
+            if sym not in (EPSILON, OTHER) and (len(sym) != 1 or sym not in alphabet):
                 raise ValueError("Simbol invalid (nu e in alfabet) sau lungime != 1.")
             transitions.setdefault((src, sym), set()).add(dest)
 
         return cls(states, alphabet, transitions, initial, finals)
 
-    def is_deterministic(self) -> bool:
+    @classmethod
+    def from_words(cls, words: Set[str]) -> "Automaton":
+        """
+        Construieste un AFD (arbore de prefixe) care accepta exact cuvintele date.
+        """
+        states = {"q0"}
+        alphabet: Set[str] = set()
+        transitions: Dict[Tuple[str, str], Set[str]] = {}
+        finals: Set[str] = set()
+        for word in sorted(words):
+            current = "q0"
+            for ch in word:
+                alphabet.add(ch)
+                dests = transitions.get((current, ch))
+                if dests is None:
+                    dest = f"q{len(states)}"
+                    states.add(dest)
+                    dests = transitions[(current, ch)] = {dest}
+                current = next(iter(dests))
+            finals.add(current)
+        return cls(states, alphabet, transitions, "q0", finals)
+
+    @classmethod
+    def from_compiled(cls, compiled: CompiledDFA) -> "Automaton":
+        """
+        Reconstruieste automatul dintr-o forma compilata (de ex. incarcata din
+        cache); forma compilata este refolosita, nu se mai construieste din nou.
+        """
+        names = compiled.state_names
+        symbols_of_class: Dict[int, List[str]] = {}
+        for sym, sym_class in compiled.symbol_class.items():
+            if isinstance(sym, str):
+                symbols_of_class.setdefault(sym_class, []).append(sym)
+
+        transitions: Dict[Tuple[str, str], Set[str]] = {}
+        width = compiled.num_classes
+        for state in range(1, len(names)):
+            row = state * width
+            other_dest = compiled.table[row]
+            if other_dest != DEAD_STATE:
+                transitions[(names[state], OTHER)] = {names[other_dest]}
+            for sym_class, symbols in symbols_of_class.items():
+                dest = compiled.table[row + sym_class]
+                if dest == other_dest or dest == DEAD_STATE:
+                    continue
+                for sym in symbols:
+                    transitions[(names[state], sym)] = {names[dest]}
+
+        finals = {names[idx] for idx in range(1, len(names)) if compiled.finals[idx]}
+        tags = {names[idx]: tag for idx, tag in enumerate(compiled.tags) if tag}
+        automaton = cls(
+            set(names[1:]),
+            set(compiled.alphabet),
+            transitions,
+            names[compiled.start],
+            finals,
+            tags,
+        )
+        automaton._compiled = compiled
+        return automaton
+
+    @classmethod
+    def tagged_union(cls, components: List[Tuple[str, "Automaton"]]) -> "Automaton":
+        """
+        Construieste un singur AFD care recunoaste reuniunea limbajelor date,
+        prin constructia produs (doar starile accesibile). Componentele
+        nedeterministe sunt determinizate in prealabil. Fiecare stare finala
+        primeste eticheta primei componente (in ordinea listei) care o accepta,
+        deci ordinea componentelor da prioritatea la egalitate de lungime.
+        """
+        components = [(tag, automaton.to_dfa()) for tag, automaton in components]
+
+        alphabet: Set[str] = set()
+        for _, automaton in components:
+            alphabet |= automaton.alphabet
+
+        def step(automaton: "Automaton", state: Optional[str], sym: str):
+            if state is None:
+                return None
+            dests = automaton.transitions.get((state, sym))
+            if not dests:
+                dests = automaton.transitions.get((state, OTHER))
+            return next(iter(dests)) if dests else None
+
+        def name_of(product: Tuple[Optional[str], ...]) -> str:
+            return "|".join(state if state is not None else "-" for state in product)
+
+        start = tuple(automaton.initial_state for _, automaton in components)
+        names = {start: name_of(start)}
+        transitions: Dict[Tuple[str, str], Set[str]] = {}
+        finals: Set[str] = set()
+        tags: Dict[str, str] = {}
+        queue = [start]
+        while queue:
+            product = queue.pop()
+            src = names[product]
+            for (tag, automaton), state in zip(components, product):
+                if state in automaton.final_states:
+                    finals.add(src)
+                    tags[src] = tag
+                    break
+
+            other_next = tuple(
+                step(automaton, state, OTHER)
+                for (_, automaton), state in zip(components, product)
+            )
+            moves = [(OTHER, other_next)]
+            for sym in sorted(alphabet):
+                nxt = tuple(
+                    step(automaton, state, sym)
+                    for (_, automaton), state in zip(components, product)
+                )
+                # Simbolurile care se comporta ca 'other' nu mai au tranzitie proprie
+                if nxt != other_next:
+                    moves.append((sym, nxt))
+
+            for sym, nxt in moves:
+                if all(state is None for state in nxt):
+                    continue
+                if nxt not in names:
+                    names[nxt] = name_of(nxt)
+                    queue.append(nxt)
+                transitions[(src, sym)] = {names[nxt]}
+
+        return cls(
+            set(names.values()), alphabet, transitions, names[start], finals, tags
+        )
+
+    # Proprietati structurale: se calculeaza o singura data si se invalideaza
+    # doar prin metodele de modificare (add_state, add_transition, ...)
+    _CACHED_PROPERTIES = (
+        "deterministic",
+        "reachable_states",
+        "complete",
+        "dead_states",
+    )
+
+    def _invalidate(self) -> None:
+        """Sterge proprietatile calculate si forma compilata dupa o modificare"""
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+        self._compiled = None
+        self._simulator = None
+
+    @cached_property
+    def deterministic(self) -> bool:
         # Nu permite epsilon in DFA si toate tranzitiile au cel mult o destinatie.
         for (src, sym), dests in self.transitions.items():
             if sym == EPSILON:
@@ -255,47 +1179,429 @@ class Automaton:
                 return False
         return True
 
+    @cached_property
+    def reachable_states(self) -> Set[str]:
+        """Starile accesibile din starea initiala"""
+        successors: Dict[str, Set[str]] = {}
+        for (src, _), dests in self.transitions.items():
+            successors.setdefault(src, set()).update(dests)
+        reached = {self.initial_state}
+        stack = [self.initial_state]
+        while stack:
+            state = stack.pop()
+            for dest in successors.get(state, ()):
+                if dest not in reached:
+                    reached.add(dest)
+                    stack.append(dest)
+        return reached
+
+    @cached_property
+    def complete(self) -> bool:
+        """Fiecare stare are tranzitie pe fiecare simbol din alfabet"""
+        for state in self.states:
+            if self.transitions.get((state, OTHER)):
+                continue
+            for sym in self.alphabet:
+                if not self.transitions.get((state, sym)):
+                    return False
+        return True
+
+    @cached_property
+    def dead_states(self) -> Set[str]:
+        """Starile din care nu se mai poate ajunge intr-o stare finala"""
+        predecessors: Dict[str, Set[str]] = {}
+        for (src, _), dests in self.transitions.items():
+            for dest in dests:
+                predecessors.setdefault(dest, set()).add(src)
+        alive = set(self.final_states)
+        stack = list(self.final_states)
+        while stack:
+            state = stack.pop()
+            for src in predecessors.get(state, ()):
+                if src not in alive:
+                    alive.add(src)
+                    stack.append(src)
+        return self.states - alive
+
+    def is_deterministic(self) -> bool:
+        return self.deterministic
+
+    def add_state(self, state: str, final: bool = False) -> None:
+        self.states.add(state)
+        if final:
+            self.final_states.add(state)
+        self._invalidate()
+
+    def set_final(self, state: str, final: bool = True) -> None:
+        if state not in self.states:
+            raise ValueError(f"Starea '{state}' nu exista in 'states'.")
+        if final:
+            self.final_states.add(state)
+        else:
+            self.final_states.discard(state)
+        self._invalidate()
+
+    def set_initial(self, state: str) -> None:
+        if state not in self.states:
+            raise ValueError(f"Starea '{state}' nu exista in 'states'.")
+        self.initial_state = state
+        self._invalidate()
+
+    def add_transition(self, src: str, sym: str, dest: str) -> None:
+        if src not in self.states or dest not in self.states:
+            raise ValueError("Stari necunoscute in tranzitie.")
+        if sym not in (EPSILON, OTHER) and sym not in self.alphabet:
+            raise ValueError(f"Simbolul '{sym}' nu exista in alfabet.")
+        self.transitions.setdefault((src, sym), set()).add(dest)
+        self._invalidate()
+
+    def remove_transition(self, src: str, sym: str, dest: str) -> None:
+        dests = self.transitions.get((src, sym))
+        if not dests or dest not in dests:
+            raise ValueError(f"Tranzitia ({src},{sym})->{dest} nu exista.")
+        dests.discard(dest)
+        if not dests:
+            del self.transitions[(src, sym)]
+        self._invalidate()
+
     # Pentru DFA, calculeaza starea urmatoare pentru o tranzitie.
     def next_states(self, state: str, symbol: str) -> Set[str]:
         return self.transitions.get((state, symbol), set())
 
+    def compile(self) -> CompiledDFA:
+        """
+        Doar pentru DFA. Construieste (o singura data) forma compilata cu tabel dens
+        de tranzitii, folosita de accepts/longest_accepted_prefix/match_length.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledDFA.from_automaton(self)
+        return self._compiled
+
+    def simulator(self) -> CompiledNFA:
+        """
+        Construieste (o singura data) simulatorul cu bitset-uri, folosit pentru AFN.
+        """
+        if self._simulator is None:
+            self._simulator = CompiledNFA(self)
+        return self._simulator
+
+    def _matcher(self) -> Union[CompiledDFA, CompiledNFA]:
+        return self.compile() if self.deterministic else self.simulator()
+
+    def lazy(self) -> LazyDFA:
+        """
+        Automatul ca operand pentru operatiile algebrice: union (a | b),
+        intersection (a & b), difference (a - b), complement (~a),
+        concatenation (a + b) si star. Rezultatul este un LazyDFA, ale carui
+        stari se construiesc doar cand sunt vizitate; to_automaton() il face explicit.
+        """
+        return LazyDFA.from_automaton(self)
+
+    def union(self, other: Union["Automaton", LazyDFA]) -> LazyDFA:
+        return self.lazy().union(other)
+
+    def intersection(self, other: Union["Automaton", LazyDFA]) -> LazyDFA:
+        return self.lazy().intersection(other)
+
+    def difference(self, other: Union["Automaton", LazyDFA]) -> LazyDFA:
+        return self.lazy().difference(other)
+
+    def complement(self) -> LazyDFA:
+        return self.lazy().complement()
+
+    def concatenation(self, other: Union["Automaton", LazyDFA]) -> LazyDFA:
+        return self.lazy().concatenation(other)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __add__ = concatenation
+
+    def __invert__(self) -> LazyDFA:
+        return self.complement()
+
+    def star(self) -> LazyDFA:
+        return self.lazy().star()
+
+    def equivalent(self, other: Union["Automaton", LazyDFA]) -> bool:
+        """
+        Verifica daca automatele (AFD, AFN sau rezultate ale operatiilor)
+        accepta acelasi limbaj; vezi LazyDFA.distinguishing_word.
+        """
+        return self.lazy().equivalent(other)
+
+    def distinguishing_word(self, other: Union["Automaton", LazyDFA]) -> Optional[str]:
+        """Secventa acceptata de un singur automat, sau None daca sunt echivalente"""
+        return self.lazy().distinguishing_word(other)
+
+    def is_subset(self, other: Union["Automaton", LazyDFA]) -> bool:
+        """Verifica daca orice secventa acceptata de automat e acceptata de 'other'"""
+        return self.lazy().is_subset(other)
+
+    def subset_counterexample(
+        self, other: Union["Automaton", LazyDFA]
+    ) -> Optional[str]:
+        """O secventa acceptata de automat si respinsa de 'other', sau None"""
+        return self.lazy().subset_counterexample(other)
+
+    def to_dfa(self) -> "Automaton":
+        """
+        Construieste un AFD echivalent prin constructia submultimilor.
+        Fiecare submultime (inchisa epsilon) este creata o singura data.
+        """
+        if self.deterministic:
+            return self
+        nfa = self.simulator()
+
+        def name_of(mask: int) -> str:
+            members = [
+                nfa.state_names[idx]
+                for idx in range(len(nfa.state_names))
+                if mask >> idx & 1
+            ]
+            return "{" + ",".join(members) + "}"
+
+        names = {nfa.start: name_of(nfa.start)}
+        transitions: Dict[Tuple[str, str], Set[str]] = {}
+        finals: Set[str] = set()
+        queue = [nfa.start]
+        while queue:
+            mask = queue.pop()
+            src = names[mask]
+            if mask & nfa.finals:
+                finals.add(src)
+            other_next = nfa.step(mask, OTHER)
+            moves = [(OTHER, other_next)]
+            for sym in sorted(self.alphabet):
+                nxt = nfa.step(mask, sym)
+                if nxt != other_next:
+                    moves.append((sym, nxt))
+            for sym, nxt in moves:
+                if not nxt:
+                    continue
+                if nxt not in names:
+                    names[nxt] = name_of(nxt)
+                    queue.append(nxt)
+                transitions[(src, sym)] = {names[nxt]}
+
+        return Automaton(
+            set(names.values()), self.alphabet, transitions, names[nfa.start], finals
+        )
+
+    def minimize(self) -> "Automaton":
+        """
+        Intoarce AFD-ul minimal echivalent (algoritmul lui Hopcroft).
+        Starile inaccesibile si cele din care nu se mai ajunge intr-o stare
+        finala sunt eliminate; starile finale cu etichete diferite raman distincte.
+        """
+        dfa = self.to_dfa()
+        useful = dfa.reachable_states - dfa.dead_states
+        if dfa.initial_state not in useful:
+            # Limbaj vid: o singura stare, fara tranzitii
+            return Automaton(
+                {dfa.initial_state}, dfa.alphabet, {}, dfa.initial_state, set()
+            )
+
+        symbols = sorted(dfa.alphabet) + [OTHER]
+
+        def delta(state: str, sym: str) -> Optional[str]:
+            dests = dfa.transitions.get((state, sym))
+            if not dests and sym != OTHER:
+                dests = dfa.transitions.get((state, OTHER))
+            dest = next(iter(dests)) if dests else None
+            return dest if dest in useful else None
+
+        # Automatul complet are in plus starea capcana (None)
+        all_states: List[Optional[str]] = sorted(useful)
+        all_states.append(None)
+        inverse: Dict[str, Dict[Optional[str], List[Optional[str]]]] = {}
+        for sym in symbols:
+            preimage: Dict[Optional[str], List[Optional[str]]] = {}
+            for state in all_states:
+                dest = delta(state, sym) if state is not None else None
+                preimage.setdefault(dest, []).append(state)
+            inverse[sym] = preimage
+
+        # Partitia initiala: nefinale (inclusiv capcana) si finale grupate dupa eticheta
+        groups: Dict[Tuple[bool, Optional[str]], Set[Optional[str]]] = {}
+        for state in all_states:
+            is_final = state in dfa.final_states
+            key = (is_final, dfa.tags.get(state) if is_final else None)
+            groups.setdefault(key, set()).add(state)
+        blocks = list(groups.values())
+        block_of: Dict[Optional[str], int] = {}
+        for idx, block in enumerate(blocks):
+            for state in block:
+                block_of[state] = idx
+
+        # Se poate omite din lista de lucru cel mai mare bloc
+        largest = max(range(len(blocks)), key=lambda idx: len(blocks[idx]))
+        worklist = [idx for idx in range(len(blocks)) if idx != largest]
+        in_worklist = set(worklist)
+        while worklist:
+            current = worklist.pop()
+            in_worklist.discard(current)
+            splitter = list(blocks[current])
+            for sym in symbols:
+                preimage = inverse[sym]
+                touched: Dict[int, Set[Optional[str]]] = {}
+                for state in splitter:
+                    for src in preimage.get(state, ()):
+                        touched.setdefault(block_of[src], set()).add(src)
+                for idx, inside in touched.items():
+                    if len(inside) == len(blocks[idx]):
+                        continue
+                    outside = blocks[idx] - inside
+                    blocks[idx] = inside
+                    new_idx = len(blocks)
+                    blocks.append(outside)
+                    for state in outside:
+                        block_of[state] = new_idx
+                    if idx in in_worklist:
+                        worklist.append(new_idx)
+                        in_worklist.add(new_idx)
+                    else:
+                        smaller = idx if len(inside) <= len(outside) else new_idx
+                        worklist.append(smaller)
+                        in_worklist.add(smaller)
+
+        # Fiecare bloc este numit dupa cea mai mica stare din el
+        names: Dict[int, str] = {}
+        for idx, block in enumerate(blocks):
+            members = [state for state in block if state is not None]
+            if members:
+                names[idx] = min(members)
+
+        # Daca un simbol duce in capcana dar 'other' nu, tranzitia explicita
+        # trebuie pastrata catre o stare capcana reala
+        sink = "qDead"
+        while sink in useful:
+            sink += "_"
+        states = set(names.values())
+
+        transitions: Dict[Tuple[str, str], Set[str]] = {}
+        finals: Set[str] = set()
+        tags: Dict[str, str] = {}
+        for idx, name in names.items():
+            state = next(state for state in blocks[idx] if state is not None)
+            if state in dfa.final_states:
+                finals.add(name)
+                if state in dfa.tags:
+                    tags[name] = dfa.tags[state]
+            other_dest = delta(state, OTHER)
+            other_block = block_of[other_dest]
+            if other_dest is not None:
+                transitions[(name, OTHER)] = {names[other_block]}
+            for sym in symbols[:-1]:
+                dest = delta(state, sym)
+                if block_of[dest] == other_block:
+                    continue
+                if dest is None:
+                    states.add(sink)
+                    transitions[(name, sym)] = {sink}
+                else:
+                    transitions[(name, sym)] = {names[block_of[dest]]}
+
+        return Automaton(
+            states,
+            dfa.alphabet,
+            transitions,
+            names[block_of[dfa.initial_state]],
+            finals,
+            tags,
+        )
+
     def accepts(self, sequence: str) -> bool:
         """
-        Doar pentru DFA (altfel arunca ValueError). Lipsa tranzitiei => respinge.
+        Verifica daca secventa este acceptata (AFD sau AFN).
+        Lipsa tranzitiei => respinge.
         """
-        if not self.is_deterministic():
-            raise ValueError("Automatul nu este determinist.")
-        current = self.initial_state
-        for ch in sequence:
-            if ch not in self.alphabet:
-                return False
-            dests = self.next_states(current, ch)
-            if not dests:
-                return False
-            # determinist => o singura dest
-            current = next(iter(dests))
-        return current in self.final_states
+        return self._matcher().accepts(sequence)
 
     def longest_accepted_prefix(self, sequence: str) -> str:
         """
-        Doar pentru DFA. Intoarce cel mai lung prefix al secventei care este acceptat.
+        Intoarce cel mai lung prefix al secventei care este acceptat.
         """
-        if not self.is_deterministic():
-            raise ValueError("Automatul nu este determinist.")
-        current = self.initial_state
-        last_accept_idx = -1
-        for idx, ch in enumerate(sequence):
-            if ch not in self.alphabet:
-                break
-            dests = self.next_states(current, ch)
-            if not dests:
-                break
-            current = next(iter(dests))
-            if current in self.final_states:
-                last_accept_idx = idx
-        if last_accept_idx >= 0:
-            return sequence[: last_accept_idx + 1]
-        return ""
+        return sequence[: self.match_length(sequence)]
+
+    def _batch(self, function: Callable, cache_size: int) -> Callable:
+        """Functia aplicata fiecarei secvente, cu cache LRU optional pentru duplicate"""
+        if cache_size:
+            return lru_cache(maxsize=cache_size)(function)
+        return function
+
+    def accepts_many(
+        self, sequences: Iterable[str], cache_size: int = 0
+    ) -> Iterator[bool]:
+        """
+        Ca accepts, pentru un sir (posibil nesfarsit) de secvente: automatul
+        compilat se obtine o singura data, iar rezultatele se produc pe rand.
+        Cu cache_size > 0 rezultatele pentru ultimele secvente distincte sunt
+        memorate (util cand intrarea contine multe duplicate).
+        """
+        return map(self._batch(self._matcher().accepts, cache_size), sequences)
+
+    def longest_prefixes(
+        self, sequences: Iterable[str], cache_size: int = 0
+    ) -> Iterator[str]:
+        """Ca longest_accepted_prefix, pentru un sir de secvente (vezi accepts_many)"""
+        match_length = self._matcher().match_length
+
+        def prefix(sequence: str) -> str:
+            return sequence[: match_length(sequence)]
+
+        return map(self._batch(prefix, cache_size), sequences)
+
+    def run_batch(
+        self, sequences: Union[Sequence[str], Sequence[bytes], "np.ndarray"]
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Doar pentru DFA; necesita NumPy. Verifica un lot de secvente de aceeasi
+        lungime: secventele sunt codificate intr-o matrice (uint8 cand toate
+        caracterele sunt sub 256) parcursa coloana cu coloana prin tabelul
+        compilat. Se poate da si direct matricea de coduri (n x lungime).
+        Intoarce (masca de acceptare, lungimile celor mai lungi prefixe acceptate).
+        """
+        if np is None:
+            raise ImportError("run_batch necesita NumPy (pip install numpy)")
+        compiled = self.compile()
+        if isinstance(sequences, np.ndarray):
+            if sequences.ndim != 2:
+                raise ValueError(
+                    "Matricea de secvente trebuie sa aiba doua dimensiuni."
+                )
+            return compiled.run_batch(sequences)
+
+        sequences = list(sequences)
+        length = len(sequences[0]) if sequences else 0
+        if any(len(sequence) != length for sequence in sequences):
+            raise ValueError("Secventele din lot trebuie sa aiba aceeasi lungime.")
+        if sequences and isinstance(sequences[0], (bytes, bytearray)):
+            data = np.frombuffer(b"".join(sequences), dtype=np.uint8)
+        else:
+            joined = "".join(sequences)
+            try:
+                data = np.frombuffer(joined.encode("latin-1"), dtype=np.uint8)
+            except UnicodeEncodeError:
+                data = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32)
+        return compiled.run_batch(data.reshape(len(sequences), length))
+
+    def match_length(self, text: Buffer, start: int = 0) -> int:
+        """
+        Intoarce lungimea celui mai lung prefix acceptat care incepe la pozitia
+        'start' in text (0 daca nu exista), fara a copia textul.
+        Pentru bytes/memoryview fiecare octet este interpretat ca un caracter.
+        """
+        return self._matcher().match_length(text, start)
+
+    def match_token(self, text: Buffer, start: int = 0) -> Tuple[int, Optional[str]]:
+        """
+        Doar pentru DFA. Ca match_length, dar intoarce si eticheta starii finale
+        in care s-a oprit cea mai lunga potrivire (pentru automatele combinate).
+        """
+        compiled = self.compile()
+        length, state = compiled.longest_match(text, start)
+        return length, compiled.tags[state]
 
     def pretty_states(self) -> str:
         return "{" + ", ".join(sorted(self.states)) + "}"
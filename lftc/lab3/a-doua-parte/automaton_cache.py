@@ -0,0 +1,91 @@
+"""
+Cache binar pentru automatele compilate (AFD minimizate + tabele dense).
+
+Format fisier (little-endian, cu exceptia tabelelor care folosesc ordinea
+nativa a octetilor, inclusa in cheie):
+
+    header:  magic "AFDC" | versiune u32 | cheie sha256 (32 octeti) | nr. intrari u32
+    intrare: nume | valoare u32 | AFD compilat (vezi CompiledDFA.to_bytes)
+
+Tabelul de tranzitii al fiecarui AFD este aliniat la 4 octeti, astfel incat
+fisierul este mapat in memorie (mmap) si tabelele sunt folosite direct, fara copiere.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Iterable, Optional, Tuple
+
+from automaton import CompiledDFA, read_string, write_string
+
+CACHE_MAGIC = b"AFDC"
+CACHE_VERSION = 1
+
+_HEADER = struct.Struct("<4sI32sI")
+
+
+def source_key(paths: Iterable[str], extra: Iterable[str] = ()) -> bytes:
+    """Cheia cache-ului: hash peste continutul fisierelor sursa si configuratie"""
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_VERSION}:{sys.byteorder}".encode())
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(path.encode("utf-8") + b"\0" + f.read() + b"\0")
+    for item in extra:
+        digest.update(item.encode("utf-8") + b"\0")
+    return digest.digest()
+
+
+def save_cache(
+    path: str, key: bytes, entries: Dict[str, Tuple[CompiledDFA, int]]
+) -> None:
+    """
+    Scrie automatele compilate in fisier. Fiecare intrare are un nume si o
+    valoare intreaga asociata (de ex. numarul de stari inainte de minimizare).
+    """
+    parts = [_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, key, len(entries))]
+    size = _HEADER.size
+    for name, (compiled, value) in entries.items():
+        chunk = write_string(name) + struct.pack("<I", value)
+        parts.append(chunk)
+        size += len(chunk)
+        chunk = compiled.to_bytes(size)
+        parts.append(chunk)
+        size += len(chunk)
+
+    # Scriere atomica: un proces care citeste nu vede niciodata un fisier partial
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(parts))
+    os.replace(tmp_path, path)
+
+
+def load_cache(path: str, key: bytes) -> Optional[Dict[str, Tuple[CompiledDFA, int]]]:
+    """
+    Incarca automatele compilate daca fisierul exista si cheia coincide.
+    Intoarce None pentru un cache lipsa, vechi sau corupt.
+    """
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        magic, version, stored_key, count = _HEADER.unpack_from(buffer, 0)
+        if magic != CACHE_MAGIC or version != CACHE_VERSION or stored_key != key:
+            buffer.close()
+            return None
+        offset = _HEADER.size
+        entries: Dict[str, Tuple[CompiledDFA, int]] = {}
+        for _ in range(count):
+            name, offset = read_string(buffer, offset)
+            (value,) = struct.unpack_from("<I", buffer, offset)
+            offset += 4
+            compiled, offset = CompiledDFA.from_buffer(buffer, offset)
+            entries[name] = (compiled, value)
+        return entries
+    except (struct.error, TypeError, ValueError, IndexError, UnicodeDecodeError):
+        return None
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Analiza lexicala pentru mai multe fisiere in paralel
+
+Fisierele (dintr-un director sau date printr-un glob) sunt impartite intre
+procese de lucru; fiecare proces incarca o singura data automatele compilate
+(din cache) si scrie pentru fiecare fisier rezultatele _fip/_ts/_tokens/_errors,
+la fel ca optiunea 1 din main.py. La final se afiseaza statisticile cumulate.
+
+Rulare:
+    python3 batch.py <director|glob> [--workers N] [--pattern "*.txt"]
+                     [--error-mode char|run] [--max-errors N]
+"""
+
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from lexical_analyzer import LexicalAnalyzer
+from main import save_results
+
+# Sufixele fisierelor generate, care nu se analizeaza din nou
+OUTPUT_SUFFIXES = ("_fip", "_ts", "_tokens", "_errors")
+
+# Analizorul fiecarui proces de lucru (creat o singura data, in initializer)
+_analyzer: Optional[LexicalAnalyzer] = None
+
+
+def _init_worker(
+    combined: bool,
+    symbol_table_backend: str,
+    error_mode: str,
+    max_errors: Optional[int],
+):
+    global _analyzer
+    _analyzer = LexicalAnalyzer(
+        combined=combined,
+        symbol_table_backend=symbol_table_backend,
+        error_mode=error_mode,
+        max_errors=max_errors,
+    )
+
+
+def lex_file(path: str) -> Dict:
+    """Analizeaza un fisier, salveaza rezultatele si intoarce statisticile lui"""
+    start = time.perf_counter()
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    tokens, symbol_table, errors = _analyzer.analyze(text)
+    lexed = time.perf_counter()
+    save_results(path.rsplit(".", 1)[0], _analyzer, tokens, verbose=False)
+    written = time.perf_counter()
+    return {
+        "path": path,
+        "chars": len(text),
+        "tokens": len(tokens),
+        "symbols": len(symbol_table),
+        "errors": len(errors),
+        "aborted": _analyzer.aborted,
+        "lex_time": lexed - start,
+        "write_time": written - lexed,
+    }
+
+
+def collect_files(target: str, pattern: str = "*.txt") -> List[str]:
+    """Fisierele de analizat: continutul unui director (dupa 'pattern') sau un glob"""
+    if os.path.isdir(target):
+        paths = glob.glob(os.path.join(target, "**", pattern), recursive=True)
+    else:
+        paths = glob.glob(target, recursive=True)
+    result = []
+    for path in sorted(paths):
+        if os.path.isfile(path) and not is_output_file(path):
+            result.append(path)
+    return result
+
+
+def is_output_file(path: str) -> bool:
+    """Fisier generat de analiza altui fisier (de ex. prog_fip.txt pentru prog.txt)"""
+    stem, ext = os.path.splitext(path)
+    for suffix in OUTPUT_SUFFIXES:
+        if stem.endswith(suffix) and os.path.isfile(stem[: -len(suffix)] + ext):
+            return True
+    return False
+
+
+def run_batch(
+    paths: List[str],
+    workers: Optional[int] = None,
+    combined: bool = True,
+    symbol_table_backend: str = "avl",
+    error_mode: str = "char",
+    max_errors: Optional[int] = None,
+) -> List[Dict]:
+    """Analizeaza fisierele in paralel si intoarce statisticile per fisier"""
+    if not paths:
+        return []
+    # Construim (daca e nevoie) cache-ul automatelor inainte de a porni procesele,
+    # ca fiecare proces sa il incarce direct
+    LexicalAnalyzer(combined=combined, symbol_table_backend=symbol_table_backend)
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(combined, symbol_table_backend, error_mode, max_errors),
+    ) as executor:
+        return list(executor.map(lex_file, paths, chunksize=chunksize))
+
+
+def print_summary(stats: List[Dict], wall_time: float, workers: int):
+    """Afiseaza statisticile cumulate pentru toate fisierele"""
+    chars = sum(item["chars"] for item in stats)
+    tokens = sum(item["tokens"] for item in stats)
+    errors = sum(item["errors"] for item in stats)
+    aborted = sum(1 for item in stats if item["aborted"])
+    lex_time = sum(item["lex_time"] for item in stats)
+    write_time = sum(item["write_time"] for item in stats)
+    busy = lex_time + write_time
+
+    print("\n=== Statistici analiza ===")
+    print(f"Fisiere analizate:    {len(stats)}")
+    print(f"Caractere:            {chars}")
+    print(f"Tokeni:               {tokens}")
+    print(f"Erori lexicale:       {errors}")
+    print(f"Analize oprite:       {aborted}")
+    print(f"Timp analiza (total): {lex_time:.3f} s")
+    print(f"Timp scriere (total): {write_time:.3f} s")
+    print(f"Timp real:            {wall_time:.3f} s ({workers} procese)")
+    if wall_time > 0:
+        print(f"Tokeni/secunda:       {tokens / wall_time:.0f}")
+        print(f"Accelerare:           {busy / wall_time:.2f}x")
+
+    # Un fisier oprit la limita de erori apare chiar daca nu are erori raportate
+    # (de ex. cu --max-errors 0)
+    with_errors = [item for item in stats if item["errors"] or item["aborted"]]
+    if with_errors:
+        print("\nFisiere cu erori lexicale:")
+        for item in with_errors:
+            note = " (analiza oprita la limita de erori)" if item["aborted"] else ""
+            print(f"  {item['path']}{note}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Analiza lexicala pentru mai multe fisiere"
+    )
+    parser.add_argument("target", help="director sau glob (ex: 'surse/**/*.mlp')")
+    parser.add_argument("--workers", type=int, default=None, help="numar de procese")
+    parser.add_argument(
+        "--pattern", default="*.txt", help="fisierele cautate intr-un director"
+    )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="foloseste modul secvential (fara AFD combinat)",
+    )
+    parser.add_argument("--symbol-table", choices=["avl", "hash"], default="avl")
+    parser.add_argument(
+        "--error-mode",
+        choices=["char", "run"],
+        default="char",
+        help="o eroare per caracter invalid sau per secventa de caractere invalide",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=None,
+        help="opreste analiza unui fisier la prima eroare peste N",
+    )
+    args = parser.parse_args()
+
+    paths = collect_files(args.target, args.pattern)
+    if not paths:
+        print(f"Nu s-a gasit niciun fisier pentru: {args.target}")
+        return
+
+    workers = args.workers or os.cpu_count() or 1
+    print(f">>> Analizam {len(paths)} fisiere cu {workers} procese...")
+    start = time.perf_counter()
+    stats = run_batch(
+        paths,
+        workers,
+        not args.sequential,
+        args.symbol_table,
+        args.error_mode,
+        args.max_errors,
+    )
+    print_summary(stats, time.perf_counter() - start, workers)
+
+
+if __name__ == "__main__":
+    main()
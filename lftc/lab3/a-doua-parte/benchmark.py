@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru analizorul lexical
+
+Masoara costul per token in functie de pozitia in fisier si de dimensiunea
+fisierului. Pentru o analiza liniara, timpul per token trebuie sa ramana
+aproximativ constant cand fisierul creste. Pe programe sintetice (corpus.py)
+raporteaza tokeni/s, MB/s si memoria maxima pentru fiecare profil, plus
+debitul automatelor (accepts / longest_accepted_prefix).
+
+Rulare:
+    python3 benchmark.py [--size CARACTERE] [--profiles mixt,erori,...] [--seed N]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from typing import List
+
+from corpus import (
+    PROFILES,
+    generate_program,
+    random_identifier,
+    random_integer,
+    random_real,
+)
+from automaton import np
+from lexical_analyzer import SYMBOL_TABLE_BACKENDS, LexicalAnalyzer
+
+
+def load_sample(path: str = "test_program.txt") -> str:
+    """Citeste programul de test folosit ca bloc de baza"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def bench_line_column(analyzer: LexicalAnalyzer, text: str, samples: int = 2000):
+    """Compara costul get_line_column la inceputul si la sfarsitul textului"""
+    analyzer.get_line_column(text, 0)  # construieste indexul de linii
+
+    start = time.perf_counter()
+    for i in range(samples):
+        analyzer.get_line_column(text, i % 100)
+    t_begin = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(samples):
+        analyzer.get_line_column(text, len(text) - 1 - i % 100)
+    t_end = time.perf_counter() - start
+
+    print(f"  get_line_column inceput: {t_begin / samples * 1e6:8.3f} us/apel")
+    print(f"  get_line_column sfarsit: {t_end / samples * 1e6:8.3f} us/apel")
+
+
+def bench_scaling(analyzer: LexicalAnalyzer, block: str, sizes=(10, 20, 40, 80)):
+    """Analizeaza texte de dimensiuni crescatoare si raporteaza timpul per token"""
+    print(f"  {'Copii':>6} {'Caractere':>10} {'Tokeni':>8} {'us/token':>10}")
+    for copies in sizes:
+        text = "\n".join([block] * copies)
+        start = time.perf_counter()
+        tokens, _, _ = analyzer.analyze(text)
+        elapsed = time.perf_counter() - start
+        per_token = elapsed / max(len(tokens), 1) * 1e6
+        print(f"  {copies:>6} {len(text):>10} {len(tokens):>8} {per_token:>10.3f}")
+
+
+def bench_symbol_tables(count: int = 50000):
+    """Compara implementarile tabelei de simboluri pe siruri sortate si aleatoare"""
+    sorted_stream = [f"v{i:06d}" for i in range(count)]
+    random_stream = list(sorted_stream)
+    random.Random(0).shuffle(random_stream)
+
+    print(f"  {'Tabela':<8} {'Flux':<10} {'us/simbol':>10}")
+    for name, table_class in SYMBOL_TABLE_BACKENDS.items():
+        for label, stream in (("sortat", sorted_stream), ("aleator", random_stream)):
+            table = table_class()
+            start = time.perf_counter()
+            for symbol in stream:
+                table.add(symbol)
+            for symbol in stream:
+                table.get_position(symbol)
+            elapsed = time.perf_counter() - start
+            print(f"  {name:<8} {label:<10} {elapsed / (2 * count) * 1e6:>10.3f}")
+
+
+def measure_analyze(analyzer: LexicalAnalyzer, text: str):
+    """Timpul analizei si memoria maxima alocata in timpul ei (rulari separate)"""
+    start = time.perf_counter()
+    tokens, _, errors = analyzer.analyze(text)
+    elapsed = time.perf_counter() - start
+
+    # tracemalloc incetineste analiza, deci memoria se masoara intr-o rulare separata
+    tracemalloc.start()
+    analyzer.analyze(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(tokens), len(errors), elapsed, peak
+
+
+def bench_profiles(
+    analyzer: LexicalAnalyzer, profiles: List[str], size: int, seed: int
+):
+    """Debitul analizei pe programe sintetice, pentru fiecare profil"""
+    print(
+        f"  {'Profil':<15} {'Caractere':>10} {'Tokeni':>8} {'Erori':>7} "
+        f"{'Tokeni/s':>10} {'MB/s':>7} {'Memorie MB':>11}"
+    )
+    for profile in profiles:
+        text = generate_program(profile, size, seed)
+        tokens, errors, elapsed, peak = measure_analyze(analyzer, text)
+        megabytes = len(text.encode("utf-8")) / 1e6
+        print(
+            f"  {profile:<15} {len(text):>10} {tokens:>8} {errors:>7} "
+            f"{tokens / elapsed:>10.0f} {megabytes / elapsed:>7.2f} {peak / 1e6:>11.2f}"
+        )
+
+
+def bench_profile_scaling(
+    analyzer: LexicalAnalyzer, profile: str, size: int, seed: int
+):
+    """Curba de scalare: timp per token si memorie pentru dimensiuni crescatoare"""
+    print(f"  Profil: {profile}")
+    print(f"  {'Caractere':>10} {'Tokeni':>8} {'us/token':>10} {'Memorie MB':>11}")
+    for factor in (0.25, 0.5, 1, 2):
+        text = generate_program(profile, int(size * factor), seed)
+        tokens, _, elapsed, peak = measure_analyze(analyzer, text)
+        per_token = elapsed / max(tokens, 1) * 1e6
+        print(f"  {len(text):>10} {tokens:>8} {per_token:>10.3f} {peak / 1e6:>11.2f}")
+
+
+def bench_automata(analyzer: LexicalAnalyzer, count: int, seed: int):
+    """Debitul accepts / longest_accepted_prefix pe secvente generate"""
+    rnd = random.Random(seed)
+    generators = [random_identifier, random_integer, random_real]
+    # Secvente valide si invalide pentru fiecare automat (sufixe care opresc potrivirea)
+    samples = [
+        rnd.choice(generators)(rnd) + rnd.choice(["", "", "@", ".x", "+1"])
+        for _ in range(count)
+    ]
+    megabytes = sum(len(sample) for sample in samples) / 1e6
+
+    print(
+        f"  {'Automat':<12} {'Operatie':<25} "
+        f"{'secv/s':>10} {'MB/s':>7} {'Acceptate':>10}"
+    )
+    automata = [
+        ("identifier", analyzer.afd_identifier),
+        ("integer", analyzer.afd_integer),
+        ("real", analyzer.afd_real),
+    ]
+    for name, automaton in automata:
+        for label, operation in (
+            ("accepts", automaton.accepts),
+            ("longest_accepted_prefix", automaton.longest_accepted_prefix),
+        ):
+            start = time.perf_counter()
+            results = [operation(sample) for sample in samples]
+            elapsed = time.perf_counter() - start
+            accepted = sum(1 for result in results if result)
+            print(
+                f"  {name:<12} {label:<25} {count / elapsed:>10.0f} "
+                f"{megabytes / elapsed:>7.2f} {accepted:>10}"
+            )
+
+
+def bench_batch_acceptance(analyzer: LexicalAnalyzer, count: int, seed: int):
+    """accepts pe rand vs. accepts_many (fara / cu cache LRU), secvente cu duplicate"""
+    rnd = random.Random(seed)
+    pool = [random_identifier(rnd) for _ in range(count // 20)]
+    samples = [rnd.choice(pool) for _ in range(count)]
+    automaton = analyzer.afd_identifier
+
+    print(f"  {count} secvente, {len(pool)} distincte")
+    print(f"  {'Varianta':<35} {'secv/s':>10}")
+    variants = [
+        ("accepts() apelat pe rand", lambda: [automaton.accepts(s) for s in samples]),
+        ("accepts_many()", lambda: list(automaton.accepts_many(samples))),
+        (
+            "accepts_many(cache_size=4096)",
+            lambda: list(automaton.accepts_many(samples, 4096)),
+        ),
+        ("longest_prefixes()", lambda: list(automaton.longest_prefixes(samples))),
+        (
+            "longest_prefixes(cache_size=4096)",
+            lambda: list(automaton.longest_prefixes(samples, 4096)),
+        ),
+    ]
+    for label, run in variants:
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<35} {count / elapsed:>10.0f}")
+
+
+def bench_numpy_batch(analyzer: LexicalAnalyzer, count: int, seed: int):
+    """run_batch (NumPy, pe coloane) vs. accepts_many pe coduri de lungime fixa"""
+    if np is None:
+        print("  NumPy nu este instalat; se sare peste aceasta sectiune")
+        return
+    rnd = random.Random(seed)
+    automaton = analyzer.afd_integer
+    print(f"  {'Lungime':>8} {'accepts_many secv/s':>20} {'run_batch secv/s':>17}")
+    for length in (4, 10, 32):
+        samples = [
+            "".join(rnd.choice("0123456789") for _ in range(length))
+            for _ in range(count)
+        ]
+        start = time.perf_counter()
+        list(automaton.accepts_many(samples))
+        t_python = time.perf_counter() - start
+        start = time.perf_counter()
+        automaton.run_batch(samples)
+        t_numpy = time.perf_counter() - start
+        print(f"  {length:>8} {count / t_python:>20.0f} {count / t_numpy:>17.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pentru analizorul lexical")
+    parser.add_argument(
+        "--size", type=int, default=200_000, help="caractere per program generat"
+    )
+    parser.add_argument(
+        "--profiles",
+        default=",".join(PROFILES),
+        help="profilurile din corpus.py, separate prin virgula",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    profiles = [profile for profile in args.profiles.split(",") if profile]
+
+    analyzer = LexicalAnalyzer()
+    block = load_sample()
+
+    print("=== Linie/coloana ===")
+    bench_line_column(analyzer, "\n".join([block] * 200))
+
+    print("\n=== Scalare analyze() ===")
+    bench_scaling(analyzer, block)
+
+    print("\n=== Tabela de simboluri ===")
+    bench_symbol_tables()
+
+    print("\n=== Programe sintetice ===")
+    bench_profiles(analyzer, profiles, args.size, args.seed)
+
+    print("\n=== Scalare pe programe sintetice ===")
+    bench_profile_scaling(
+        analyzer, profiles[0] if profiles else "mixt", args.size, args.seed
+    )
+
+    print("\n=== Automate (accepts / longest_accepted_prefix) ===")
+    bench_automata(analyzer, 50_000, args.seed)
+
+    print("\n=== Verificare in lot (accepts_many / longest_prefixes) ===")
+    bench_batch_acceptance(analyzer, 200_000, args.seed)
+
+    print("\n=== Verificare vectorizata (NumPy, lungime fixa) ===")
+    bench_numpy_batch(analyzer, 100_000, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Format binar pentru rezultatele analizei lexicale (FIP + TS), citit de etapele
+urmatoare ale compilatorului fara parsarea fisierelor text.
+
+Format fisier (little-endian, toate campurile aliniate la 4 octeti):
+
+    header:   magic "FIPB" | versiune u32 | nr. tokeni u32 | nr. simboluri u32 |
+              octeti simboluri u32
+    FIP:      nr. tokeni inregistrari de 4 x i32:
+              cod token | pozitie TS (-1) | linie | coloana
+    TS:       nr. simboluri + 1 offset-uri u32 in zona de simboluri
+    simboluri: textele simbolurilor (UTF-8), in ordinea pozitiilor din TS
+
+Cititorul mapeaza fisierul in memorie (mmap), iar FIP-ul si simbolurile sunt
+vederi (memoryview) direct peste fisier.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterator, List, Tuple, Union
+
+from lexical_analyzer import HashSymbolTable, SymbolTable, TokenStore
+
+FIP_MAGIC = b"FIPB"
+FIP_VERSION = 1
+
+# Numarul de campuri i32 dintr-o inregistrare FIP
+RECORD_FIELDS = 4
+
+_HEADER = struct.Struct("<4sIIII")
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def save_binary(
+    path: str, tokens: TokenStore, symbol_table: Union[SymbolTable, HashSymbolTable]
+) -> None:
+    """Scrie FIP-ul (cu linia si coloana fiecarui token) si TS-ul in format binar"""
+    count = len(tokens)
+    codes = tokens.fip_codes
+    records = array("i", bytes(4 * RECORD_FIELDS * count))
+    view = memoryview(records)
+    # Inregistrarile se completeaza pe coloane, direct din TokenStore
+    view[0::RECORD_FIELDS] = array("i", [codes[kind] for kind in tokens.types])
+    view[1::RECORD_FIELDS] = tokens.positions
+    view[2::RECORD_FIELDS] = tokens.lines
+    view[3::RECORD_FIELDS] = tokens.columns
+    view.release()
+
+    symbols = sorted(symbol_table.get_all_symbols(), key=lambda item: item[1])
+    offsets = array("I", [0])
+    pool = []
+    size = 0
+    for symbol, _ in symbols:
+        data = symbol.encode("utf-8")
+        pool.append(data)
+        size += len(data)
+        offsets.append(size)
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(FIP_MAGIC, FIP_VERSION, count, len(symbols), size))
+        f.write(_little_endian(records))
+        f.write(_little_endian(offsets))
+        f.write(b"".join(pool))
+
+
+class BinaryOutput:
+    """
+    Cititor pentru formatul binar. Se foloseste ca FIP-ul (len, index,
+    iterare peste perechi (cod, pozitie TS)); 'records' este o vedere i32
+    peste inregistrari (RECORD_FIELDS valori per token), iar symbol(pos)
+    decodeaza un simbol din TS doar la cerere.
+    """
+
+    def __init__(self, path: str):
+        # Header-ul si dimensiunea se verifica inainte de mapare: un fisier gol
+        # nu poate fi mapat, iar unul trunchiat nu trebuie citit
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(
+                    f"Fisierul '{path}' este gol sau trunchiat (lipseste header-ul)"
+                )
+            magic, version, count, symbols, size = _HEADER.unpack(header)
+            if magic != FIP_MAGIC or version != FIP_VERSION:
+                raise ValueError(
+                    f"Fisierul '{path}' nu este un FIP binar (versiunea {FIP_VERSION})"
+                )
+            offset = _HEADER.size
+            records_end = offset + 4 * RECORD_FIELDS * count
+            offsets_end = records_end + 4 * (symbols + 1)
+            if offsets_end + size > os.fstat(f.fileno()).st_size:
+                raise ValueError(f"Fisierul '{path}' este trunchiat")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+
+        self.count = count
+        self.symbol_count = symbols
+        if sys.byteorder == "little":
+            self.records = buffer[offset:records_end].cast("i")
+            self.offsets = buffer[records_end:offsets_end].cast("I")
+        else:
+            # Pe masinile big-endian valorile trebuie copiate si inversate
+            self.records = array("i", buffer[offset:records_end])
+            self.records.byteswap()
+            self.offsets = array("I", buffer[records_end:offsets_end])
+            self.offsets.byteswap()
+        self.pool = buffer[offsets_end : offsets_end + size]
+        self._buffer = buffer
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Tuple[int, int]:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("Index FIP in afara limitelor")
+        base = index * RECORD_FIELDS
+        return self.records[base], self.records[base + 1]
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        # Parcurgere dupa index: nu se creeaza vederi noi peste fisier, care
+        # ar impiedica inchiderea lui cat timp iteratorul este in viata
+        records = self.records
+        for base in range(0, self.count * RECORD_FIELDS, RECORD_FIELDS):
+            yield records[base], records[base + 1]
+
+    def location(self, index: int) -> Tuple[int, int]:
+        """(linie, coloana) pentru tokenul 'index'"""
+        base = index * RECORD_FIELDS
+        return self.records[base + 2], self.records[base + 3]
+
+    def symbol_bytes(self, position: int) -> memoryview:
+        """
+        Textul UTF-8 al simbolului de la pozitia data din TS (fara copiere).
+        Vederea tine fisierul mapat pana este eliberata (release) sau colectata.
+        """
+        return self.pool[self.offsets[position] : self.offsets[position + 1]]
+
+    def symbol(self, position: int) -> str:
+        """Simbolul de la pozitia data din TS"""
+        return str(self.symbol_bytes(position), "utf-8")
+
+    def symbols(self) -> List[str]:
+        """Toate simbolurile din TS, in ordinea pozitiilor"""
+        return [self.symbol(position) for position in range(self.symbol_count)]
+
+    def close(self):
+        """
+        Elibereaza vederile cititorului si inchide maparea fisierului. Daca
+        apelantul mai tine vederi obtinute cu symbol_bytes, maparea se inchide
+        abia cand acestea sunt eliberate.
+        """
+        for view in (self.records, self.offsets, self.pool, self._buffer):
+            if isinstance(view, memoryview):
+                view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self) -> "BinaryOutput":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
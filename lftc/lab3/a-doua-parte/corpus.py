@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Generator de programe MLP sintetice, pentru benchmark-uri
+
+Fiecare profil produce alt amestec de tokeni:
+- mixt:            instructiuni obisnuite (declaratii, if/while, expresii, I/O)
+- identificatori:  expresii lungi cu identificatori aleatori
+- numere:          constante intregi (zecimal, octal, hex, binar) si reale
+- siruri:          siruri de caractere lungi, cu secvente escape
+- sortat:          declaratii cu identificatori generati in ordine (v000001, ...)
+- erori:           text cu multe caractere invalide intre tokeni
+
+Rulare:
+    python3 corpus.py <profil> <caractere> <fisier> [--seed N]
+"""
+
+import argparse
+import random
+from typing import Callable, Dict, List
+
+OPERATORS = ["+", "-", "*", "/", "%"]
+COMPARISONS = ["==", "!=", "<", ">", "<=", ">="]
+LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_"
+DIGITS = "0123456789"
+INVALID_CHARS = "@#$~`?^"
+
+
+def random_identifier(rnd: random.Random) -> str:
+    """Identificator aleator de 1..12 caractere"""
+    length = rnd.randint(1, 12)
+    return rnd.choice(LETTERS) + "".join(
+        rnd.choice(LETTERS + DIGITS) for _ in range(length - 1)
+    )
+
+
+def random_integer(rnd: random.Random) -> str:
+    """Constanta intreaga aleatoare (zecimal, octal, hex sau binar)"""
+    kind = rnd.random()
+    if kind < 0.7:
+        return str(rnd.randint(0, 10**6))
+    if kind < 0.8:
+        return "0" + format(rnd.randint(1, 4096), "o")
+    if kind < 0.9:
+        return "0x" + format(rnd.randint(0, 1 << 24), "X")
+    return "0b" + format(rnd.randint(0, 255), "b")
+
+
+def random_real(rnd: random.Random) -> str:
+    """Constanta reala aleatoare, uneori cu exponent si sufix"""
+    value = f"{rnd.randint(0, 9999)}.{rnd.randint(0, 9999)}"
+    if rnd.random() < 0.3:
+        value += f"e{rnd.choice(['', '+', '-'])}{rnd.randint(0, 30)}"
+    if rnd.random() < 0.1:
+        value += rnd.choice("fFlL")
+    return value
+
+
+def random_string(rnd: random.Random, length: int) -> str:
+    """Sir de caractere de 'length' simboluri, cu secvente escape"""
+    parts = []
+    for _ in range(length):
+        if rnd.random() < 0.05:
+            parts.append(rnd.choice(['\\"', "\\n", "\\\\"]))
+        else:
+            parts.append(rnd.choice(LETTERS + DIGITS + " .,;:!"))
+    return '"' + "".join(parts) + '"'
+
+
+def _expression(
+    rnd: random.Random, terms: int, term: Callable[[random.Random], str]
+) -> str:
+    items = [term(rnd)]
+    for _ in range(terms - 1):
+        items.append(rnd.choice(OPERATORS))
+        items.append(term(rnd))
+    return " ".join(items)
+
+
+def _mixed_statement(rnd: random.Random, index: int) -> str:
+    kind = rnd.random()
+    name = random_identifier(rnd)
+    if kind < 0.3:
+        value = _expression(
+            rnd,
+            rnd.randint(1, 4),
+            lambda r: r.choice([random_identifier, random_integer])(r),
+        )
+        return f"int {name} = {value};"
+    if kind < 0.45:
+        return f"float {name} = {random_real(rnd)} * {random_identifier(rnd)};"
+    if kind < 0.6:
+        cond = (
+            f"{random_identifier(rnd)} {rnd.choice(COMPARISONS)} {random_integer(rnd)}"
+        )
+        return (
+            f"if ({cond}) {{\n    write({name});\n}} "
+            f"else {{\n    {name} = {name} + 1;\n}}"
+        )
+    if kind < 0.7:
+        return (
+            f"while ({name} < {random_integer(rnd)}) {{\n    {name} = {name} + 1;\n}}"
+        )
+    if kind < 0.8:
+        return f"string {name} = {random_string(rnd, rnd.randint(0, 20))};"
+    if kind < 0.85:
+        return f"char {name} = '{rnd.choice(LETTERS)}';"
+    if kind < 0.95:
+        return f"read({name});"
+    left, right = random_identifier(rnd), random_identifier(rnd)
+    return f"bool {name} = {rnd.choice(['true', 'false'])} && {left} || !{right};"
+
+
+def _identifier_statement(rnd: random.Random, index: int) -> str:
+    return f"{random_identifier(rnd)} = {_expression(rnd, 12, random_identifier)};"
+
+
+def _numeric_statement(rnd: random.Random, index: int) -> str:
+    def number(r: random.Random) -> str:
+        return r.choice([random_integer, random_real])(r)
+
+    return f"x = {_expression(rnd, 12, number)};"
+
+
+def _string_statement(rnd: random.Random, index: int) -> str:
+    return f"write({random_string(rnd, rnd.randint(200, 2000))});"
+
+
+def _sorted_statement(rnd: random.Random, index: int) -> str:
+    return f"int v{index:06d} = {index};"
+
+
+def _error_statement(rnd: random.Random, index: int) -> str:
+    parts = []
+    for _ in range(rnd.randint(5, 20)):
+        if rnd.random() < 0.6:
+            parts.append(
+                "".join(rnd.choice(INVALID_CHARS) for _ in range(rnd.randint(1, 8)))
+            )
+        else:
+            parts.append(random_identifier(rnd))
+    return " ".join(parts)
+
+
+PROFILES: Dict[str, Callable[[random.Random, int], str]] = {
+    "mixt": _mixed_statement,
+    "identificatori": _identifier_statement,
+    "numere": _numeric_statement,
+    "siruri": _string_statement,
+    "sortat": _sorted_statement,
+    "erori": _error_statement,
+}
+
+
+def generate_program(profile: str, size: int, seed: int = 0) -> str:
+    """Genereaza un program MLP de aproximativ 'size' caractere cu profilul dat"""
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Profil necunoscut: '{profile}' (disponibile: {', '.join(PROFILES)})"
+        )
+    statement = PROFILES[profile]
+    rnd = random.Random(seed)
+    lines: List[str] = ["int main() {"]
+    total = len(lines[0]) + 1
+    index = 0
+    while total < size:
+        line = "    " + statement(rnd, index).replace("\n", "\n    ")
+        lines.append(line)
+        total += len(line) + 1
+        index += 1
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genereaza programe MLP sintetice")
+    parser.add_argument("profile", choices=sorted(PROFILES))
+    parser.add_argument("size", type=int, help="numarul aproximativ de caractere")
+    parser.add_argument("output", help="fisierul generat")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    text = generate_program(args.profile, args.size, args.seed)
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(text)
+    print(f"Generat {args.output}: {len(text)} caractere (profil {args.profile})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,361 @@
+"""
+Reanaliza lexicala incrementala (pentru editoare).
+
+Dupa o editare (offset, lungime stearsa, text inserat) nu se reanalizeaza tot
+textul: se reia analiza de la prima intrare (token sau eroare) al carei automat
+a citit vreun caracter de la offset-ul editarii incolo, si se opreste cand un
+inceput de intrare coincide cu un inceput vechi, de dupa editare (deplasat cu
+diferenta de lungime). De acolo incolo intrarile vechi sunt identice.
+
+Intrarile sunt pastrate in blocuri cu offset-uri relative, astfel incat
+deplasarea intrarilor de dupa editare costa O(1) per bloc, nu per token.
+Pentru blocuri se pastreaza numarul cumulat de intrari si maximul cumulat al
+limitelor citite, deci intrarea cu un anumit index si prima intrare afectata
+de o editare se gasesc prin cautare binara. Dupa o editare aceste valori se
+recalculeaza doar pana unde este nevoie (de obicei cateva blocuri).
+
+Tabela de simboluri doar creste: simbolurile noi primesc pozitii noi, iar cele
+care nu mai apar raman in TS pana la o analiza completa (pozitiile din FIP
+raman stabile intre editari).
+"""
+
+from bisect import bisect_right
+from itertools import accumulate
+from operator import add
+from typing import Iterator, List, Tuple, Union
+
+from lexical_analyzer import (
+    TOKEN_TYPE_INDEX,
+    TOKEN_TYPES,
+    HashSymbolTable,
+    LexicalAnalyzer,
+    SymbolTable,
+    TokenStore,
+)
+
+# Tipul intrarilor care reprezinta erori lexicale (tokenii folosesc TOKEN_TYPE_INDEX)
+ERROR_KIND = -1
+
+# Numarul de intrari dintr-un bloc
+BLOCK_SIZE = 256
+
+# Numarul de blocuri pentru care se extind odata indexurile cumulate
+INDEX_STEP = 32
+
+# Intrare: (tip, pozitie TS, inceput, lungime, limita citita, linie, coloana).
+# Limita citita este pozitia de dupa ultimul caracter citit de automat
+# (len(text) + 1 daca automatul a ajuns activ la sfarsitul textului).
+Entry = Tuple[int, int, int, int, int, int, int]
+
+
+class IncrementalLexer:
+    """
+    Pastreaza rezultatul analizei unui text si il actualizeaza la fiecare editare.
+
+    Blocul i contine intrarile blocks[i], memorate relativ: inceputul si limita
+    citita reale = valoarea memorata + shifts[i], linia reala = linia memorata +
+    line_shifts[i]; max_reach[i] este cea mai mare limita citita (relativa) din bloc.
+    """
+
+    def __init__(
+        self, analyzer: LexicalAnalyzer, text: str = "", block_size: int = BLOCK_SIZE
+    ):
+        self.analyzer = analyzer
+        self.compiled = analyzer.afd_combined.compile()
+        self.block_size = block_size
+        self.fip_codes = [analyzer.fip_code(name) for name in TOKEN_TYPES]
+        self.symbol_table = analyzer.symbol_table_class()
+        self.text = text
+        entries, _ = self._lex(text, 0, 1, 0)
+        self.blocks = self._make_blocks(entries)
+        self.shifts = [0] * len(self.blocks)
+        self.line_shifts = [0] * len(self.blocks)
+        self.max_reach = [self._block_reach(block) for block in self.blocks]
+        # Indexuri cumulate, calculate pentru un prefix al blocurilor:
+        # ends[i] = numarul de intrari din blocurile 0..i,
+        # reach[i] = cea mai mare limita citita (reala) din blocurile 0..i
+        self._ends: List[int] = []
+        self._reach: List[int] = []
+        self._count = len(entries)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _make_blocks(self, entries: List[Entry]) -> List[List[Entry]]:
+        size = self.block_size
+        return [entries[i : i + size] for i in range(0, len(entries), size)]
+
+    @staticmethod
+    def _block_reach(block: List[Entry]) -> int:
+        return max(entry[4] for entry in block)
+
+    def _extend_index(self):
+        """Calculeaza indexurile cumulate pentru urmatoarele INDEX_STEP blocuri"""
+        start = len(self._ends)
+        stop = start + INDEX_STEP
+        count = self._ends[-1] if self._ends else 0
+        reach = self._reach[-1] if self._reach else -1
+        ends = accumulate(map(len, self.blocks[start:stop]), initial=count)
+        reaches = accumulate(
+            map(add, self.max_reach[start:stop], self.shifts[start:stop]),
+            max,
+            initial=reach,
+        )
+        next(ends)
+        next(reaches)
+        self._ends.extend(ends)
+        self._reach.extend(reaches)
+
+    def _normalized(self, block_idx: int) -> List[Entry]:
+        """Intrarile blocului cu offset-urile si liniile reale"""
+        block = self.blocks[block_idx]
+        shift = self.shifts[block_idx]
+        line_shift = self.line_shifts[block_idx]
+        if not shift and not line_shift:
+            return block
+        return [
+            (
+                kind,
+                ts_pos,
+                start + shift,
+                length,
+                reach + shift,
+                line + line_shift,
+                column,
+            )
+            for kind, ts_pos, start, length, reach, line, column in block
+        ]
+
+    def _lex(self, text: str, pos: int, line: int, line_start: int, sync=None):
+        """
+        Analizeaza de la 'pos' (sfarsitul unei intrari) pana la sfarsitul textului
+        sau pana cand sync(inceput) este adevarat pentru urmatoarea intrare.
+        Intoarce intrarile gasite si pozitia de oprire.
+        """
+        analyzer = self.analyzer
+        analyzer.symbol_table = self.symbol_table
+        compiled = self.compiled
+        tags = compiled.tags
+        entries: List[Entry] = []
+        scanned = pos
+        while True:
+            pos = analyzer.skip_whitespace(text, pos)
+            if pos >= len(text) or (sync is not None and sync(pos)):
+                return entries, pos
+
+            newlines = text.count("\n", scanned, pos)
+            if newlines:
+                line += newlines
+                line_start = text.rfind("\n", scanned, pos) + 1
+            scanned = pos
+            column = pos - line_start + 1
+
+            length, state, stop = compiled.scan(text, pos)
+            if length:
+                token_type, ts_pos = analyzer.classify(
+                    tags[state], text[pos : pos + length]
+                )
+                entries.append(
+                    (
+                        TOKEN_TYPE_INDEX[token_type],
+                        ts_pos,
+                        pos,
+                        length,
+                        stop + 1,
+                        line,
+                        column,
+                    )
+                )
+                pos += length
+            else:
+                entries.append((ERROR_KIND, -1, pos, 1, stop + 1, line, column))
+                pos += 1
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """(indexul blocului, indexul primei intrari din bloc) pentru intrarea data"""
+        ends = self._ends
+        while len(ends) < len(self.blocks) and (not ends or ends[-1] <= index):
+            self._extend_index()
+        block_idx = bisect_right(ends, index)
+        return block_idx, ends[block_idx - 1] if block_idx else 0
+
+    def _iter_from(self, index: int) -> Iterator[Tuple[int, Entry]]:
+        """Intrarile (cu offset-urile reale) incepand cu intrarea 'index'"""
+        block_idx, base = self._locate(index)
+        local = index - base
+        for block_idx in range(block_idx, len(self.blocks)):
+            shift = self.shifts[block_idx]
+            line_shift = self.line_shifts[block_idx]
+            for entry in self.blocks[block_idx][local:]:
+                if shift or line_shift:
+                    kind, ts_pos, start, length, reach, line, column = entry
+                    entry = (
+                        kind,
+                        ts_pos,
+                        start + shift,
+                        length,
+                        reach + shift,
+                        line + line_shift,
+                        column,
+                    )
+                yield index, entry
+                index += 1
+            local = 0
+
+    def _first_affected(self, offset: int) -> int:
+        """Prima intrare al carei automat a citit un caracter de la 'offset' incolo"""
+        # Primul bloc cu o limita citita dincolo de offset (maximul cumulat creste)
+        reach = self._reach
+        while len(reach) < len(self.blocks) and (not reach or reach[-1] <= offset):
+            self._extend_index()
+        block_idx = bisect_right(reach, offset)
+        if block_idx == len(self.blocks):
+            return self._count
+        base = self._ends[block_idx - 1] if block_idx else 0
+        shift = self.shifts[block_idx]
+        for local, entry in enumerate(self.blocks[block_idx]):
+            if entry[4] + shift > offset:
+                return base + local
+        return self._ends[block_idx]
+
+    def update(self, offset: int, deleted: int, inserted: str) -> Tuple[int, int, int]:
+        """
+        Aplica editarea: sterge 'deleted' caractere de la 'offset' si insereaza
+        'inserted'. Intoarce (indexul primei intrari modificate, numarul de
+        intrari eliminate, numarul de intrari noi).
+        """
+        old = self.text
+        if offset < 0 or deleted < 0 or offset + deleted > len(old):
+            raise ValueError(
+                f"Editare in afara textului: offset {offset}, lungime {deleted} "
+                f"(text de {len(old)})"
+            )
+        text = old[:offset] + inserted + old[offset + deleted :]
+        delta = len(inserted) - deleted
+        line_delta = inserted.count("\n") - old.count("\n", offset, offset + deleted)
+        edit_end = offset + len(inserted)
+
+        # Reluam analiza de la sfarsitul ultimei intrari neafectate
+        first = self._first_affected(offset)
+        pos, line = 0, 1
+        if first:
+            _, previous = next(self._iter_from(first - 1))
+            pos = previous[2] + previous[3]
+            line = previous[5] + old.count("\n", previous[2], pos)
+        line_start = old.rfind("\n", 0, pos) + 1
+
+        # Sincronizare: un inceput nou de dupa editare care exista si in analiza veche
+        old_entries = self._iter_from(first)
+        current = next(old_entries, None)
+        sync_index = self._count
+
+        def sync(start: int) -> bool:
+            nonlocal current, sync_index
+            if start < edit_end:
+                return False
+            target = start - delta
+            while current is not None and current[1][2] < target:
+                current = next(old_entries, None)
+            if current is not None and current[1][2] == target:
+                sync_index = current[0]
+                return True
+            return False
+
+        new_entries, _ = self._lex(text, pos, line, line_start, sync)
+        self._splice(first, sync_index, new_entries, delta, line_delta)
+        self.text = text
+        self._fix_columns(first + len(new_entries), edit_end)
+        return first, sync_index - first, len(new_entries)
+
+    def _splice(
+        self,
+        first: int,
+        end: int,
+        new_entries: List[Entry],
+        delta: int,
+        line_delta: int,
+    ):
+        """Inlocuieste intrarile [first, end) si deplaseaza intrarile urmatoare"""
+        blocks = self.blocks
+        first_block, base = self._locate(first)
+        last_block, _ = self._locate(end)
+        last_block = min(last_block + 1, len(blocks))
+
+        merged: List[Entry] = []
+        for block_idx in range(first_block, last_block):
+            merged.extend(self._normalized(block_idx))
+        tail = [
+            (
+                kind,
+                ts_pos,
+                start + delta,
+                length,
+                reach + delta,
+                line + line_delta,
+                column,
+            )
+            for kind, ts_pos, start, length, reach, line, column in merged[end - base :]
+        ]
+        merged = merged[: first - base] + new_entries + tail
+
+        if delta:
+            self.shifts[last_block:] = [
+                shift + delta for shift in self.shifts[last_block:]
+            ]
+        if line_delta:
+            self.line_shifts[last_block:] = [
+                shift + line_delta for shift in self.line_shifts[last_block:]
+            ]
+        new_blocks = self._make_blocks(merged)
+        blocks[first_block:last_block] = new_blocks
+        self.shifts[first_block:last_block] = [0] * len(new_blocks)
+        self.line_shifts[first_block:last_block] = [0] * len(new_blocks)
+        self.max_reach[first_block:last_block] = [
+            self._block_reach(block) for block in new_blocks
+        ]
+        # Indexurile cumulate raman valide doar pentru blocurile dinaintea editarii
+        del self._ends[first_block:]
+        del self._reach[first_block:]
+        self._count += len(new_entries) - (end - first)
+
+    def _fix_columns(self, index: int, edit_end: int):
+        """Recalculeaza coloanele intrarilor vechi de pe ultima linie a editarii"""
+        text = self.text
+        newline = text.find("\n", edit_end)
+        if newline == -1:
+            newline = len(text)
+        line_start = text.rfind("\n", 0, edit_end) + 1
+
+        block_idx, base = self._locate(index)
+        local = index - base
+        for block_idx in range(block_idx, len(self.blocks)):
+            entries = self.blocks[block_idx]
+            shift = self.shifts[block_idx]
+            for idx in range(local, len(entries)):
+                entry = entries[idx]
+                start = entry[2] + shift
+                if start >= newline:
+                    return
+                entries[idx] = entry[:6] + (start - line_start + 1,)
+            local = 0
+
+    def entries(self) -> Iterator[Entry]:
+        """Toate intrarile (tokeni si erori), in ordinea din text"""
+        for _, entry in self._iter_from(0):
+            yield entry
+
+    def result(
+        self,
+    ) -> Tuple[TokenStore, Union[SymbolTable, HashSymbolTable], List[str]]:
+        """Rezultatul curent, in aceeasi forma ca LexicalAnalyzer.analyze()"""
+        analyzer = self.analyzer
+        analyzer.symbol_table = self.symbol_table
+        analyzer.errors = []
+        tokens = TokenStore(self.text, self.fip_codes)
+        for kind, ts_pos, start, length, _, line, column in self.entries():
+            if kind == ERROR_KIND:
+                analyzer.report_error(line, column, self.text[start])
+            else:
+                tokens.append(kind, ts_pos, start, length, line, column)
+        analyzer.fip = tokens.fip
+        return tokens, self.symbol_table, analyzer.errors
@@ -1,11 +1,85 @@
-from typing import List, Optional, Tuple
+import os
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set, TextIO, Tuple, Union
 
-from automaton import Automaton
+from automaton import DEAD_STATE, Automaton
+from automaton_cache import load_cache, save_cache, source_key
+
+# Fisierul in care se pastreaza automatele compilate intre rulari
+CACHE_FILE = "lexer_cache.bin"
+
+# Automatele incarcate din fisiere: atribut -> fisier sursa
+AUTOMATON_FILES = {
+    "afd_identifier": "afd_identifier.txt",
+    "afd_integer": "afd_integer.txt",
+    "afd_real": "afd_real.txt",
+    "afd_string": "afd_string.txt",
+    "afd_char": "afd_char.txt",
+}
+
+# Automatele obtinute prin reuniune (vezi merged_components): atribut -> nume in cache
+MERGED_AUTOMATA = {
+    "afd_word": "cuvinte",
+    "afd_operator": "operatori",
+    "afd_combined": "combinat",
+}
+
+# Cuvintele cheie ale limbajului (configurabile)
+KEYWORDS_FILE = "keywords.txt"
+
+# Operatorii si delimitatorii (configurabili, de orice lungime)
+OPERATORS_FILE = "operators.txt"
+DELIMITERS_FILE = "delimiters.txt"
+
+# Tipurile de tokeni, in ordinea codurilor folosite in TokenStore
+TOKEN_TYPES = [
+    "KEYWORD",
+    "IDENTIFIER",
+    "CONSTANT_INT",
+    "CONSTANT_REAL",
+    "OPERATOR",
+    "DELIMITER",
+    "CONSTANT_STRING",
+    "CONSTANT_CHAR",
+]
+TOKEN_TYPE_INDEX = {name: idx for idx, name in enumerate(TOKEN_TYPES)}
+
+# Tipurile de tokeni care nu se pun in TS
+NO_TS_TYPES = {"KEYWORD", "OPERATOR", "DELIMITER"}
+
+# Modurile de raportare a erorilor: o eroare pentru fiecare caracter invalid,
+# sau o singura eroare pentru o secventa de caractere invalide consecutive
+ERROR_MODES = ("char", "run")
+
+# Lungimea maxima a unei secvente invalide afisate in mesajul de eroare
+MAX_ERROR_TEXT = 20
+
+# Cate caractere poate citi iter_tokens dupa inceputul unui token (memoria ramane
+# limitata si pentru un sir de caractere neterminat)
+MAX_LOOKAHEAD = 1 << 20
+
+
+def load_words(path: str) -> Set[str]:
+    """
+    Citeste o lista de cuvinte dintr-un fisier: separate prin spatii albe,
+    liniile care incep cu # sunt comentarii
+    """
+    words: Set[str] = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.lstrip().startswith("#"):
+                words.update(line.split())
+    return words
 
 
 class Token:
     """Reprezinta un token (atom lexical)"""
 
+    __slots__ = ("token_type", "value", "line", "column")
+
     def __init__(self, token_type: str, value: str, line: int, column: int):
         self.token_type = token_type
         self.value = value
@@ -16,23 +90,172 @@ class Token:
         return f"Token({self.token_type}, '{self.value}', L{self.line}:C{self.column})"
 
 
+class TokenStore:
+    """
+    Lista de tokeni memorata pe coloane (array-uri paralele): tipul, pozitia
+    in TS, offset-ul de inceput, lungimea, linia si coloana. Valoarea si
+    obiectele Token se construiesc doar la cerere, din textul sursa.
+    Se foloseste ca o lista de Token (len, index, iterare).
+    """
+
+    def __init__(self, text: str, fip_codes: List[int]):
+        self.text = text
+        # fip_codes[tip] = codul FIP pentru tipul de token cu indexul 'tip'
+        self.fip_codes = fip_codes
+        self.types = array("b")
+        self.positions = array("i")
+        self.starts = array("q")
+        self.lengths = array("i")
+        self.lines = array("i")
+        self.columns = array("i")
+        self.fip = FipView(self)
+
+    def append(
+        self,
+        type_index: int,
+        ts_pos: int,
+        start: int,
+        length: int,
+        line: int,
+        column: int,
+    ):
+        self.types.append(type_index)
+        self.positions.append(ts_pos)
+        self.starts.append(start)
+        self.lengths.append(length)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def extend(self, columns: Tuple[array, array, array, array, array, array]):
+        """Adauga in bloc tokenii dati pe coloane (aceeasi ordine ca la append)"""
+        types, positions, starts, lengths, lines, token_columns = columns
+        self.types.extend(types)
+        self.positions.extend(positions)
+        self.starts.extend(starts)
+        self.lengths.extend(lengths)
+        self.lines.extend(lines)
+        self.columns.extend(token_columns)
+
+    def value(self, index: int) -> str:
+        """Valoarea tokenului, extrasa din textul sursa"""
+        start = self.starts[index]
+        return self.text[start : start + self.lengths[index]]
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return Token(
+            TOKEN_TYPES[self.types[index]],
+            self.value(index),
+            self.lines[index],
+            self.columns[index],
+        )
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self):
+        return "[" + ", ".join(repr(token) for token in self) + "]"
+
+
+class FipView:
+    """FIP-ul ca secventa de perechi (cod token, pozitie TS), calculat din TokenStore"""
+
+    def __init__(self, store: TokenStore):
+        self.store = store
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __getitem__(self, index: int) -> Tuple[int, int]:
+        store = self.store
+        return store.fip_codes[store.types[index]], store.positions[index]
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        codes = self.store.fip_codes
+        return zip((codes[t] for t in self.store.types), self.store.positions)
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class BSTNode:
-    """Nod pentru arborele binar de cautare"""
+    """Nod pentru arborele binar de cautare (echilibrat AVL)"""
+
+    __slots__ = ("symbol", "position", "height", "left", "right")
 
     def __init__(self, symbol: str, position: int):
         self.symbol = symbol
         self.position = position
+        self.height = 1
         self.left: Optional["BSTNode"] = None
         self.right: Optional["BSTNode"] = None
 
 
+def _height(node: Optional[BSTNode]) -> int:
+    return node.height if node is not None else 0
+
+
+def _update(node: BSTNode):
+    node.height = 1 + max(_height(node.left), _height(node.right))
+
+
+def _rotate_right(node: BSTNode) -> BSTNode:
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node: BSTNode) -> BSTNode:
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node: BSTNode) -> BSTNode:
+    """Reechilibreaza nodul (rotatii AVL) si intoarce noua radacina a subarborelui"""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
 class SymbolTable:
-    """Tabela de simboluri pentru identificatori si constante - implementare cu BST"""
+    """
+    Tabela de simboluri pentru identificatori si constante - implementare cu
+    arbore binar de cautare echilibrat (AVL). Operatiile sunt iterative, deci
+    si sirurile sortate de simboluri (v0001, v0002, ...) raman in O(log n).
+    """
 
     def __init__(self):
         self.root: Optional[BSTNode] = None
         self.next_pos = 0
 
+    def __len__(self) -> int:
+        return self.next_pos
+
     def add(self, symbol: str) -> int:
         """Adauga un simbol in tabela si returneaza pozitia lui"""
         if self.root is None:
@@ -40,56 +263,62 @@ class SymbolTable:
             self.next_pos += 1
             return self.root.position
 
-        return self._add_recursive(self.root, symbol)
-
-    def _add_recursive(self, node: BSTNode, symbol: str) -> int:
-        """Adauga recursiv un simbol in BST"""
-        if symbol == node.symbol:
-            # Simbolul exista deja
-            return node.position
-        elif symbol < node.symbol:
-            if node.left is None:
-                node.left = BSTNode(symbol, self.next_pos)
-                self.next_pos += 1
-                return node.left.position
-            else:
-                return self._add_recursive(node.left, symbol)
-        else:  # symbol > node.symbol
-            if node.right is None:
-                node.right = BSTNode(symbol, self.next_pos)
-                self.next_pos += 1
-                return node.right.position
+        # Coboram in arbore retinand drumul, pentru reechilibrare la intoarcere
+        path: List[BSTNode] = []
+        node = self.root
+        while True:
+            if symbol == node.symbol:
+                # Simbolul exista deja
+                return node.position
+            path.append(node)
+            child = node.left if symbol < node.symbol else node.right
+            if child is None:
+                break
+            node = child
+
+        new_node = BSTNode(symbol, self.next_pos)
+        self.next_pos += 1
+        if symbol < node.symbol:
+            node.left = new_node
+        else:
+            node.right = new_node
+
+        # Urcam pe drum si reechilibram fiecare stramos
+        for idx in range(len(path) - 1, -1, -1):
+            node = path[idx]
+            old_height = node.height
+            subtree = _rebalance(node)
+            if idx == 0:
+                self.root = subtree
+            elif path[idx - 1].left is node:
+                path[idx - 1].left = subtree
             else:
-                return self._add_recursive(node.right, symbol)
+                path[idx - 1].right = subtree
+            if subtree is node and node.height == old_height:
+                break
+        return new_node.position
 
     def get_position(self, symbol: str) -> Optional[int]:
         """Returneaza pozitia unui simbol din tabela"""
-        return self._search(self.root, symbol)
-
-    def _search(self, node: Optional[BSTNode], symbol: str) -> Optional[int]:
-        """Cauta recursiv un simbol in BST"""
-        if node is None:
-            return None
-        if symbol == node.symbol:
-            return node.position
-        elif symbol < node.symbol:
-            return self._search(node.left, symbol)
-        else:
-            return self._search(node.right, symbol)
-
-    def _inorder_traversal(
-        self, node: Optional[BSTNode], result: List[Tuple[str, int]]
-    ):
-        """Parcurgere inorder pentru a obtine simbolurile sortate"""
-        if node is not None:
-            self._inorder_traversal(node.left, result)
-            result.append((node.symbol, node.position))
-            self._inorder_traversal(node.right, result)
+        node = self.root
+        while node is not None:
+            if symbol == node.symbol:
+                return node.position
+            node = node.left if symbol < node.symbol else node.right
+        return None
 
     def get_all_symbols(self) -> List[Tuple[str, int]]:
-        """Returneaza toate simbolurile sortate alfabetic"""
+        """Returneaza toate simbolurile sortate alfabetic (parcurgere inorder)"""
         result: List[Tuple[str, int]] = []
-        self._inorder_traversal(self.root, result)
+        stack: List[BSTNode] = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result.append((node.symbol, node.position))
+            node = node.right
         return result
 
     def __repr__(self):
@@ -100,67 +329,95 @@ class SymbolTable:
         return "\n".join(f"{pos}: {symbol}" for symbol, pos in symbols_sorted)
 
 
-class LexicalAnalyzer:
-    """Analizor lexical bazat pe automate finite"""
+class HashSymbolTable:
+    """
+    Tabela de simboluri indexata cu dictionar: cautare/adaugare in O(1).
+    Pozitiile sunt atribuite in aceeasi ordine ca in SymbolTable.
+    """
 
     def __init__(self):
-        # Incarcam automatele finite
-        self.afd_identifier = Automaton.from_file("afd_identifier.txt")
-        self.afd_integer = Automaton.from_file("afd_integer.txt")
-        self.afd_real = Automaton.from_file("afd_real.txt")
+        self.positions: Dict[str, int] = {}
+        self.next_pos = 0
+
+    def __len__(self) -> int:
+        return self.next_pos
+
+    def add(self, symbol: str) -> int:
+        """Adauga un simbol in tabela si returneaza pozitia lui"""
+        position = self.positions.get(symbol)
+        if position is None:
+            position = self.positions[symbol] = self.next_pos
+            self.next_pos += 1
+        return position
+
+    def get_position(self, symbol: str) -> Optional[int]:
+        """Returneaza pozitia unui simbol din tabela"""
+        return self.positions.get(symbol)
+
+    def get_all_symbols(self) -> List[Tuple[str, int]]:
+        """Returneaza toate simbolurile sortate alfabetic"""
+        return sorted(self.positions.items())
+
+    def __repr__(self):
+        """Afiseaza simbolurile sortate dupa pozitie (ordinea inserarii)"""
+        return "\n".join(f"{pos}: {symbol}" for symbol, pos in self.positions.items())
+
+
+# Implementarile disponibile pentru tabela de simboluri
+SYMBOL_TABLE_BACKENDS = {
+    "avl": SymbolTable,
+    "hash": HashSymbolTable,
+}
+
+
+# Analizorul fiecarui proces de lucru pentru analiza paralela a unui fisier
+_chunk_analyzer: Optional["LexicalAnalyzer"] = None
+
+
+def _init_chunk_worker(options: Dict):
+    global _chunk_analyzer
+    _chunk_analyzer = LexicalAnalyzer(symbol_table_backend="hash", **options)
+
 
+def _lex_chunk_job(job: Tuple[str, int, int, bool]):
+    return _chunk_analyzer.lex_chunk(*job)
+
+
+class LexicalAnalyzer:
+    """Analizor lexical bazat pe automate finite"""
+
+    def __init__(
+        self,
+        combined: bool = True,
+        cache_path: Optional[str] = CACHE_FILE,
+        symbol_table_backend: str = "avl",
+        keywords_path: str = KEYWORDS_FILE,
+        operators_path: str = OPERATORS_FILE,
+        delimiters_path: str = DELIMITERS_FILE,
+        error_mode: str = "char",
+        max_errors: Optional[int] = None,
+        cache_key: Optional[bytes] = None,
+    ):
         # Tabele de simboluri
-        self.symbol_table = SymbolTable()
-
-        # Cuvinte cheie (specifice limbajului MLP)
-        self.keywords = {
-            "int",
-            "float",
-            "char",
-            "string",
-            "bool",
-            "if",
-            "else",
-            "while",
-            "for",
-            "read",
-            "write",
-            "return",
-            "void",
-            "true",
-            "false",
-        }
+        if symbol_table_backend not in SYMBOL_TABLE_BACKENDS:
+            raise ValueError(
+                f"Tip de tabela de simboluri necunoscut: '{symbol_table_backend}'"
+            )
+        self.symbol_table_class = SYMBOL_TABLE_BACKENDS[symbol_table_backend]
+        self.cache_path = cache_path
+        self.symbol_table = self.symbol_table_class()
 
-        # Operatori si delimitatori
-        self.operators = {
-            "+",
-            "-",
-            "*",
-            "/",
-            "%",
-            "=",
-            "==",
-            "!=",
-            "<",
-            ">",
-            "<=",
-            ">=",
-            "&&",
-            "||",
-            "!",
-        }
+        # Fisierele de configurare (transmise si proceselor de lucru)
+        self.keywords_path = keywords_path
+        self.operators_path = operators_path
+        self.delimiters_path = delimiters_path
 
-        self.delimiters = {
-            "(",
-            ")",
-            "{",
-            "}",
-            "[",
-            "]",
-            ";",
-            ",",
-            ":",
-        }
+        # Cuvinte cheie (specifice limbajului MLP), recunoscute direct de AFD
+        self.keywords = load_words(keywords_path)
+
+        # Operatori si delimitatori
+        self.operators = load_words(operators_path)
+        self.delimiters = load_words(delimiters_path)
 
         # Coduri pentru FIP
         self.token_codes = {
@@ -173,10 +430,124 @@ class LexicalAnalyzer:
         }
 
         # FIP (Forma Interna a Programului)
-        self.fip: List[Tuple[int, int]] = []
+        self.fip: Union[FipView, List[Tuple[int, int]]] = []
 
         # Erori
         self.errors: List[str] = []
+        if error_mode not in ERROR_MODES:
+            raise ValueError(f"Mod de raportare a erorilor necunoscut: '{error_mode}'")
+        self.error_mode = error_mode
+        # Analiza se opreste dupa 'max_errors' erori (None = fara limita)
+        self.max_errors = max_errors
+        self.aborted = False
+
+        # Modul combinat: un singur AFD pentru toate clasele de tokeni, parcurs o
+        # singura data per token (cea mai lunga potrivire)
+        self.combined = combined
+
+        # Numarul de stari al fiecarui automat inainte/dupa minimizare
+        self.state_counts: Dict[str, Tuple[int, int]] = {}
+
+        # Incarcam automatele finite (din cache, daca este actual)
+        self.load_automata(cache_path, cache_key)
+
+        # Pentru fiecare clasa de simboluri a AFD-ului combinat: poate incepe un token?
+        compiled = self.afd_combined.compile()
+        row = compiled.start * compiled.num_classes
+        self.start_classes = compiled.symbol_class
+        self.can_start = [
+            compiled.table[row + sym_class] != DEAD_STATE
+            for sym_class in range(compiled.num_classes)
+        ]
+
+    def load_automata(self, cache_path: Optional[str], key: Optional[bytes] = None):
+        """
+        Incarca automatele compilate din cache daca fisierele sursa nu s-au
+        schimbat; altfel le construieste si rescrie cache-ul. Cheia poate fi
+        data direct (procesele de lucru folosesc cheia analizorului parinte).
+        """
+        self.cache_key = None
+        if cache_path is None:
+            self.build_automata()
+            return
+
+        names = dict(AUTOMATON_FILES, **MERGED_AUTOMATA)
+        if key is None:
+            key = source_key(
+                AUTOMATON_FILES.values(),
+                sorted(self.keywords)
+                + sorted(self.operators)
+                + sorted(self.delimiters),
+            )
+        self.cache_key = key
+        entries = load_cache(cache_path, key)
+        if entries is not None and set(entries) == set(names.values()):
+            for attr, name in names.items():
+                compiled, before = entries[name]
+                automaton = Automaton.from_compiled(compiled)
+                setattr(self, attr, automaton)
+                self.state_counts[name] = (before, len(automaton.states))
+            return
+
+        self.build_automata()
+        entries = {}
+        for attr, name in names.items():
+            entries[name] = (getattr(self, attr).compile(), self.state_counts[name][0])
+        try:
+            save_cache(cache_path, key, entries)
+        except OSError:
+            # Cache-ul este doar o optimizare; analiza merge si fara el
+            pass
+
+    def build_automata(self):
+        """Construieste automatele din fisierele text si AFD-ul combinat"""
+        for attr, path in AUTOMATON_FILES.items():
+            setattr(self, attr, self.load_automaton(path))
+
+        components = self.merged_components()
+        for attr, name in MERGED_AUTOMATA.items():
+            setattr(
+                self,
+                attr,
+                self.minimized(name, Automaton.tagged_union(components[attr])),
+            )
+
+    def merged_components(self) -> Dict[str, List[Tuple[str, Automaton]]]:
+        """
+        Componentele (eticheta, automat) ale automatelor reunite, in ordinea
+        prioritatii: la egalitate o stare finala primeste eticheta primei componente.
+        """
+        keywords = Automaton.from_words(self.keywords)
+        operators = Automaton.from_words(self.operators)
+        delimiters = Automaton.from_words(self.delimiters)
+        return {
+            # Identificatori si cuvinte cheie: arborele de prefixe al cuvintelor cheie
+            # reunit cu AFD-ul identificatorilor; finalele sunt etichetate cu tipul
+            "afd_word": [("KEYWORD", keywords), ("IDENTIFIER", self.afd_identifier)],
+            # Operatori si delimitatori: arbore de prefixe, cea mai lunga potrivire
+            "afd_operator": [("OPERATOR", operators), ("DELIMITER", delimiters)],
+            # Componentele sunt in ordinea incercarilor din modul secvential
+            "afd_combined": [
+                ("CONSTANT_STRING", self.afd_string),
+                ("CONSTANT_CHAR", self.afd_char),
+                ("OPERATOR", operators),
+                ("DELIMITER", delimiters),
+                ("CONSTANT_REAL", self.afd_real),
+                ("CONSTANT_INT", self.afd_integer),
+                ("KEYWORD", keywords),
+                ("IDENTIFIER", self.afd_identifier),
+            ],
+        }
+
+    def load_automaton(self, path: str) -> Automaton:
+        """Incarca un automat din fisier si il inlocuieste cu AFD-ul minimal"""
+        return self.minimized(path, Automaton.from_file(path))
+
+    def minimized(self, name: str, automaton: Automaton) -> Automaton:
+        """Minimizeaza automatul si retine numarul de stari inainte/dupa"""
+        result = automaton.minimize()
+        self.state_counts[name] = (len(automaton.states), len(result.states))
+        return result
 
     def is_whitespace(self, ch: str) -> bool:
         """Verifica daca caracterul este spatiu alb"""
@@ -190,21 +561,12 @@ class LexicalAnalyzer:
 
     def try_match_operator_or_delimiter(
         self, text: str, pos: int
-    ) -> Optional[Tuple[str, int]]:
-        """Incearca sa potriveasca un operator sau delimitator"""
-        # Incercam operatori cu 2 caractere
-        if pos + 1 < len(text):
-            two_char = text[pos : pos + 2]
-            if two_char in self.operators:
-                return (two_char, pos + 2)
-
-        # Incercam operatori/delimitatori cu 1 caracter
-        if pos < len(text):
-            one_char = text[pos]
-            if one_char in self.operators or one_char in self.delimiters:
-                return (one_char, pos + 1)
-
-        return None
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Incearca sa potriveasca cel mai lung operator sau delimitator de la 'pos';
+        intoarce (lungime, tip), sau (0, None) daca nu se potriveste nimic
+        """
+        return self.afd_operator.match_token(text, pos)
 
     def try_match_string_literal(
         self, text: str, pos: int
@@ -250,26 +612,162 @@ class LexicalAnalyzer:
 
         return None
 
+    def _build_line_index(self, text: str) -> List[int]:
+        """Construieste lista cu offset-urile de inceput ale fiecarei linii"""
+        line_starts = [0]
+        idx = text.find("\n")
+        while idx != -1:
+            line_starts.append(idx + 1)
+            idx = text.find("\n", idx + 1)
+        return line_starts
+
     def get_line_column(self, text: str, pos: int) -> Tuple[int, int]:
-        """Calculeaza linia si coloana pentru o pozitie din text"""
-        line = 1
-        column = 1
-        for i in range(pos):
-            if text[i] == "\n":
-                line += 1
-                column = 1
-            else:
-                column += 1
+        """Calculeaza linia si coloana pentru o pozitie din text (cautare binara)"""
+        # Indexul de linii se reconstruieste doar cand se schimba textul
+        if getattr(self, "_indexed_text", None) is not text:
+            self._indexed_text = text
+            self._line_starts = self._build_line_index(text)
+        line = bisect_right(self._line_starts, pos)
+        column = pos - self._line_starts[line - 1] + 1
         return (line, column)
 
-    def analyze(self, text: str) -> Tuple[List[Token], SymbolTable, List[str]]:
+    def can_start_token(self, ch: str) -> bool:
+        """Verifica daca exista vreun token care incepe cu caracterul dat"""
+        return self.can_start[self.start_classes.get(ch, 0)]
+
+    def skip_invalid(self, text: str, pos: int, limit: Optional[int] = None) -> int:
+        """
+        Sare peste caracterele care nu pot incepe niciun token (fara spatii
+        albe), cel mult pana la pozitia 'limit'
+        """
+        classes = self.start_classes
+        can_start = self.can_start
+        end = len(text) if limit is None else min(limit, len(text))
+        while (
+            pos < end
+            and not can_start[classes.get(text[pos], 0)]
+            and not self.is_whitespace(text[pos])
+        ):
+            pos += 1
+        return pos
+
+    def error_end(self, text: str, pos: int, limit: Optional[int] = None) -> int:
+        """
+        Sfarsitul erorii care incepe la 'pos': caracterul urmator sau, in modul
+        "run", sfarsitul secventei de caractere invalide (cel mult 'limit')
+        """
+        if self.error_mode == "run":
+            return self.skip_invalid(text, pos + 1, limit)
+        return pos + 1
+
+    def error_limit_reached(self) -> bool:
+        """
+        Se apeleaza inainte de a raporta o eroare: daca s-au raportat deja
+        max_errors erori, analiza trebuie oprita (self.aborted devine True)
+        """
+        if self.max_errors is not None and len(self.errors) >= self.max_errors:
+            self.aborted = True
+        return self.aborted
+
+    def match_sequential(self, text: str, pos: int) -> Tuple[int, Optional[str]]:
+        """
+        Incearca pe rand fiecare clasa de tokeni si intoarce (lungime, tip)
+        pentru prima care se potriveste; (0, None) daca nu se potriveste nimic.
+        """
+        if not self.can_start_token(text[pos]):
+            return 0, None
+
+        # Incercam sa potrivim string literal
+        string_match = self.try_match_string_literal(text, pos)
+        if string_match:
+            return string_match[1] - pos, "CONSTANT_STRING"
+
+        # Incercam sa potrivim char literal
+        char_match = self.try_match_char_literal(text, pos)
+        if char_match:
+            return char_match[1] - pos, "CONSTANT_CHAR"
+
+        # Incercam sa potrivim operator sau delimitator
+        op_len, tag = self.try_match_operator_or_delimiter(text, pos)
+        if op_len:
+            return op_len, tag
+
+        # Incercam sa potrivim un numar real (trebuie inainte de integer!)
+        real_len = self.afd_real.match_length(text, pos)
+        if real_len:
+            return real_len, "CONSTANT_REAL"
+
+        # Incercam sa potrivim un numar intreg
+        int_len = self.afd_integer.match_length(text, pos)
+        if int_len:
+            return int_len, "CONSTANT_INT"
+
+        # Incercam sa potrivim un cuvant cheie sau un identificator
+        word_len, tag = self.afd_word.match_token(text, pos)
+        if word_len:
+            return word_len, tag
+
+        return 0, None
+
+    def classify(self, token_type: str, value: str) -> Tuple[str, int]:
+        """
+        Intoarce tipul tokenului si pozitia in TS (-1 daca nu se pune in TS).
+        Cuvintele cheie sunt deja deosebite de identificatori de catre AFD.
+        """
+        if token_type in NO_TS_TYPES:
+            return token_type, -1
+        return token_type, self.symbol_table.add(value)
+
+    def fip_code(self, token_type: str) -> int:
+        """Codul FIP al unui tip de token"""
+        # Sirurile si caracterele folosesc codul constantelor intregi in FIP
+        return self.token_codes.get(token_type, self.token_codes["CONSTANT_INT"])
+
+    def make_token(
+        self, token_type: str, value: str, line: int, column: int
+    ) -> Tuple[Token, Tuple[int, int]]:
+        """
+        Construieste tokenul si intrarea FIP corespunzatoare, adaugand simbolul
+        in tabela de simboluri daca e cazul
+        """
+        token_type, ts_pos = self.classify(token_type, value)
+        return Token(token_type, value, line, column), (
+            self.fip_code(token_type),
+            ts_pos,
+        )
+
+    def report_error(self, line: int, column: int, ch: str):
+        """
+        Inregistreaza o eroare lexicala: un caracter care nu incepe niciun token
+        sau (in modul "run") o secventa de astfel de caractere
+        """
+        where = f"Eroare lexicala la linia {line}, coloana {column}"
+        if len(ch) == 1:
+            error_msg = f"{where}: caracter invalid '{ch}'"
+        else:
+            shown = ch if len(ch) <= MAX_ERROR_TEXT else ch[:MAX_ERROR_TEXT] + "..."
+            error_msg = f"{where}: secventa invalida '{shown}' ({len(ch)} caractere)"
+        self.errors.append(error_msg)
+
+    def analyze(
+        self, text: str
+    ) -> Tuple[TokenStore, Union[SymbolTable, HashSymbolTable], List[str]]:
         """
         Analizeaza textul si returneaza lista de tokeni, tabela de simboluri si erorile.
+        Daca apare o eroare peste limita max_errors, analiza se opreste inainte
+        de a o raporta (self.aborted devine True; erorile raman cel mult max_errors).
         """
-        self.fip = []
         self.errors = []
-        self.symbol_table = SymbolTable()
-        tokens: List[Token] = []
+        self.aborted = False
+        self.symbol_table = self.symbol_table_class()
+        tokens = TokenStore(text, [self.fip_code(name) for name in TOKEN_TYPES])
+        self.fip = tokens.fip
+
+        # Linia/coloana se actualizeaza incremental, doar pe portiunea parcursa
+        # de la tokenul anterior (analiza ramane liniara in lungimea textului)
+        line = 1
+        line_start = 0
+        scanned = 0
 
         pos = 0
         while pos < len(text):
@@ -278,114 +776,406 @@ class LexicalAnalyzer:
             if pos >= len(text):
                 break
 
-            line, column = self.get_line_column(text, pos)
+            newlines = text.count("\n", scanned, pos)
+            if newlines:
+                line += newlines
+                line_start = text.rfind("\n", scanned, pos) + 1
+            scanned = pos
+            column = pos - line_start + 1
 
-            # Incercam sa potrivim string literal
-            string_match = self.try_match_string_literal(text, pos)
-            if string_match:
-                value, new_pos = string_match
-                ts_pos = self.symbol_table.add(value)
-                tokens.append(Token("CONSTANT_STRING", value, line, column))
-                self.fip.append((self.token_codes["CONSTANT_INT"], ts_pos))
-                pos = new_pos
+            if self.combined:
+                length, tag = self.afd_combined.match_token(text, pos)
+            else:
+                length, tag = self.match_sequential(text, pos)
+            if length:
+                # Valoarea se extrage doar pentru tokenii care intra in TS
+                ts_pos = -1
+                if tag not in NO_TS_TYPES:
+                    ts_pos = self.symbol_table.add(text[pos : pos + length])
+                tokens.append(TOKEN_TYPE_INDEX[tag], ts_pos, pos, length, line, column)
+                pos += length
                 continue
 
-            # Incercam sa potrivim char literal
-            char_match = self.try_match_char_literal(text, pos)
-            if char_match:
-                value, new_pos = char_match
-                ts_pos = self.symbol_table.add(value)
-                tokens.append(Token("CONSTANT_CHAR", value, line, column))
-                self.fip.append((self.token_codes["CONSTANT_INT"], ts_pos))
-                pos = new_pos
-                continue
+            # Daca nu am potrivit nimic, avem o eroare lexicala; peste limita
+            # max_errors analiza se opreste fara a o mai raporta
+            if self.error_limit_reached():
+                break
+            end = self.error_end(text, pos)
+            self.report_error(line, column, text[pos:end])
+            pos = end
 
-            # Incercam sa potrivim operator sau delimitator
-            op_delim_match = self.try_match_operator_or_delimiter(text, pos)
-            if op_delim_match:
-                value, new_pos = op_delim_match
-                if value in self.operators:
-                    tokens.append(Token("OPERATOR", value, line, column))
-                    self.fip.append((self.token_codes["OPERATOR"], -1))
-                else:
-                    tokens.append(Token("DELIMITER", value, line, column))
-                    self.fip.append((self.token_codes["DELIMITER"], -1))
-                pos = new_pos
-                continue
+        return tokens, self.symbol_table, self.errors
+
+    def find_split_points(self, text: str, parts: int) -> List[int]:
+        """
+        Alege pozitii de impartire a textului in 'parts' bucati: inceputuri de
+        linie precedate de un numar par de ghilimele (deci, de regula, in afara
+        sirurilor de caractere). Pre-scanarea foloseste doar str.find/str.count;
+        corectitudinea nu depinde de ea, ci de sincronizarea din analyze_parallel.
+        """
+        points = [0]
+        quotes = 0  # ghilimele dinaintea ultimului punct ales
+        for k in range(1, parts):
+            target = max(len(text) * k // parts, points[-1] + 1)
+            idx = text.find("\n", target)
+            for _ in range(64):
+                if idx == -1 or text.count('"', points[-1], idx) % 2 == quotes % 2:
+                    break
+                idx = text.find("\n", idx + 1)
+            if idx == -1 or idx + 1 >= len(text):
+                break
+            quotes += text.count('"', points[-1], idx + 1)
+            points.append(idx + 1)
+        return points
+
+    def lex_chunk(self, chunk: str, base: int, first_line: int, last: bool):
+        """
+        Analizeaza o bucata de text care incepe la offset-ul absolut 'base',
+        la inceputul liniei 'first_line'. Se opreste la primul token care ar
+        putea continua dupa sfarsitul bucatii (daca nu e ultima bucata).
+        Intoarce coloanele tokenilor (pozitii TS locale), simbolurile locale in
+        ordinea pozitiilor, erorile (offset, linie, coloana, caracter) si
+        offset-ul absolut la care s-a oprit.
+        """
+        self.symbol_table = self.symbol_table_class()
+        compiled = self.afd_combined.compile()
+        store = TokenStore(chunk, [])
+        errors: List[Tuple[int, int, int, str]] = []
+
+        line = first_line
+        line_start = 0
+        scanned = 0
+        pos = 0
+        while True:
+            pos = self.skip_whitespace(chunk, pos)
+            newlines = chunk.count("\n", scanned, pos)
+            if newlines:
+                line += newlines
+                line_start = chunk.rfind("\n", scanned, pos) + 1
+            scanned = pos
+            if pos >= len(chunk):
+                break
+
+            length, state, stop = compiled.scan(chunk, pos)
+            if stop == len(chunk) and not last:
+                break
+            column = pos - line_start + 1
+            if length:
+                token_type, ts_pos = self.classify(
+                    compiled.tags[state], chunk[pos : pos + length]
+                )
+                store.append(
+                    TOKEN_TYPE_INDEX[token_type],
+                    ts_pos,
+                    base + pos,
+                    length,
+                    line,
+                    column,
+                )
+                pos += length
+            else:
+                errors.append((base + pos, line, column, chunk[pos]))
+                pos += 1
+
+        symbols = [
+            symbol
+            for symbol, _ in sorted(
+                self.symbol_table.get_all_symbols(), key=lambda x: x[1]
+            )
+        ]
+        columns = (
+            store.types,
+            store.positions,
+            store.starts,
+            store.lengths,
+            store.lines,
+            store.columns,
+        )
+        return columns, symbols, errors, base + pos
+
+    def lex_next(self, text: str, pos: int, tokens: TokenStore) -> int:
+        """Analizeaza un token (sau o eroare) de la 'pos'; intoarce pozitia urmatoare"""
+        compiled = self.afd_combined.compile()
+        line, column = self.get_line_column(text, pos)
+        length, state = compiled.longest_match(text, pos)
+        if length:
+            token_type, ts_pos = self.classify(
+                compiled.tags[state], text[pos : pos + length]
+            )
+            tokens.append(
+                TOKEN_TYPE_INDEX[token_type], ts_pos, pos, length, line, column
+            )
+            return pos + length
+        self.report_error(line, column, text[pos])
+        return pos + 1
+
+    def analyze_parallel(
+        self, text: str, workers: Optional[int] = None, min_chunk_size: int = 1 << 20
+    ) -> Tuple[TokenStore, Union[SymbolTable, HashSymbolTable], List[str]]:
+        """
+        Ca analyze(), dar imparte textul in bucati analizate in procese separate.
+        Rezultatele (FIP, TS, tokeni, erori) sunt identice cu analiza secventiala:
+        daca un token traverseaza granita dintre bucati, analiza continua
+        secvential de la acel token pana cand se ajunge la un inceput de token
+        deja gasit de procesul urmator, iar pozitiile din TS se renumeroteaza
+        in ordinea primei aparitii. Cu error_mode="run" sau cu max_errors se
+        foloseste analiza secventiala.
+        """
+        workers = workers or os.cpu_count() or 1
+        parts = min(workers, len(text) // max(min_chunk_size, 1))
+        if parts < 2 or self.error_mode != "char" or self.max_errors is not None:
+            return self.analyze(text)
+
+        points = self.find_split_points(text, parts) + [len(text)]
+        jobs = []
+        line = 1
+        for idx, (start, end) in enumerate(zip(points, points[1:])):
+            jobs.append((text[start:end], start, line, idx == len(points) - 2))
+            line += text.count("\n", start, end)
+
+        # Procesele de lucru folosesc aceeasi configuratie si aceeasi cheie de cache
+        options = dict(
+            combined=self.combined,
+            cache_path=self.cache_path,
+            keywords_path=self.keywords_path,
+            operators_path=self.operators_path,
+            delimiters_path=self.delimiters_path,
+            cache_key=self.cache_key,
+        )
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_chunk_worker, initargs=(options,)
+        ) as executor:
+            results = list(executor.map(_lex_chunk_job, jobs))
+
+        self.errors = []
+        self.symbol_table = self.symbol_table_class()
+        tokens = TokenStore(text, [self.fip_code(name) for name in TOKEN_TYPES])
+        self.fip = tokens.fip
+
+        pos = 0
+        for columns, symbols, errors, stop in results:
+            types, positions, starts, lengths, lines, token_columns = columns
+            error_starts = [error[0] for error in errors]
+
+            # Sincronizare: analizam secvential pana la un token/eroare gasit de worker
+            first_token = first_error = None
+            while True:
+                pos = self.skip_whitespace(text, pos)
+                if pos >= stop:
+                    break
+                idx = bisect_left(starts, pos)
+                if idx < len(starts) and starts[idx] == pos:
+                    first_token = idx
+                    first_error = bisect_left(error_starts, pos)
+                    break
+                idx = bisect_left(error_starts, pos)
+                if idx < len(error_starts) and error_starts[idx] == pos:
+                    first_token = bisect_left(starts, pos)
+                    first_error = idx
+                    break
+                pos = self.lex_next(text, pos, tokens)
 
-            # Incercam sa potrivim un numar real (trebuie inainte de integer!)
-            real_prefix = self.afd_real.longest_accepted_prefix(text[pos:])
-            if real_prefix:
-                ts_pos = self.symbol_table.add(real_prefix)
-                tokens.append(Token("CONSTANT_REAL", real_prefix, line, column))
-                self.fip.append((self.token_codes["CONSTANT_REAL"], ts_pos))
-                pos += len(real_prefix)
+            if first_token is None:
                 continue
 
-            # Incercam sa potrivim un numar intreg
-            int_prefix = self.afd_integer.longest_accepted_prefix(text[pos:])
-            if int_prefix:
-                ts_pos = self.symbol_table.add(int_prefix)
-                tokens.append(Token("CONSTANT_INT", int_prefix, line, column))
-                self.fip.append((self.token_codes["CONSTANT_INT"], ts_pos))
-                pos += len(int_prefix)
+            # Preluam rezultatele worker-ului, renumerotand pozitiile din TS
+            mapping = [-1] * len(symbols)
+            remapped = positions[first_token:]
+            for idx, ts_pos in enumerate(remapped):
+                if ts_pos >= 0:
+                    if mapping[ts_pos] < 0:
+                        mapping[ts_pos] = self.symbol_table.add(symbols[ts_pos])
+                    remapped[idx] = mapping[ts_pos]
+            tokens.extend(
+                (
+                    types[first_token:],
+                    remapped,
+                    starts[first_token:],
+                    lengths[first_token:],
+                    lines[first_token:],
+                    token_columns[first_token:],
+                )
+            )
+            for _, error_line, error_column, ch in errors[first_error:]:
+                self.report_error(error_line, error_column, ch)
+            pos = stop
+
+        while True:
+            pos = self.skip_whitespace(text, pos)
+            if pos >= len(text):
+                break
+            pos = self.lex_next(text, pos, tokens)
+
+        return tokens, self.symbol_table, self.errors
+
+    def iter_tokens(
+        self,
+        stream: TextIO,
+        chunk_size: int = 1 << 16,
+        max_lookahead: int = MAX_LOOKAHEAD,
+    ) -> Iterator[Tuple[Token, Tuple[int, int]]]:
+        """
+        Analizeaza un flux de text citit pe bucati de 'chunk_size' caractere si
+        produce pe rand perechi (token, intrare FIP), fara a retine lista de
+        tokeni sau FIP-ul. Tabela de simboluri, erorile, error_mode si
+        max_errors functioneaza ca la analyze(). Foloseste intotdeauna AFD-ul
+        combinat.
+
+        Daca automatul ajunge activ la sfarsitul bufferului (token care poate
+        continua in bucata urmatoare, de ex. un sir de caractere lung), se
+        citeste bucata urmatoare si parcurgerea continua din starea in care a
+        ramas. Dupa 'max_lookahead' caractere de la inceputul tokenului
+        automatul este oprit ca si cum ar fi intalnit un caracter invalid; tot
+        dupa 'max_lookahead' caractere se incheie si o secventa invalida.
+        """
+        self.errors = []
+        self.aborted = False
+        self.symbol_table = self.symbol_table_class()
+        compiled = self.afd_combined.compile()
+
+        buffer = ""
+        base = 0  # offset-ul absolut al lui buffer[0]
+        pos = 0
+        eof = False
+        line = 1
+        line_start = 0  # offset absolut
+        scanned = 0  # offset absolut pana la care s-au numarat liniile
+
+        def refill(keep: int) -> int:
+            """Pastreaza bufferul de la 'keep' si citeste bucata urmatoare"""
+            nonlocal buffer, base, eof
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[keep:] + chunk
+            base += keep
+            return keep
+
+        while True:
+            pos = self.skip_whitespace(buffer, pos)
+            newlines = buffer.count("\n", scanned - base, pos)
+            if newlines:
+                line += newlines
+                line_start = base + buffer.rfind("\n", scanned - base, pos) + 1
+            scanned = base + pos
+
+            if pos >= len(buffer):
+                if eof:
+                    break
+                pos -= refill(pos)
                 continue
 
-            # Incercam sa potrivim un identificator
-            id_prefix = self.afd_identifier.longest_accepted_prefix(text[pos:])
-            if id_prefix:
-                # Verificam daca e cuvant cheie
-                if id_prefix in self.keywords:
-                    tokens.append(Token("KEYWORD", id_prefix, line, column))
-                    self.fip.append((self.token_codes["KEYWORD"], -1))
-                else:
-                    ts_pos = self.symbol_table.add(id_prefix)
-                    tokens.append(Token("IDENTIFIER", id_prefix, line, column))
-                    self.fip.append((self.token_codes["IDENTIFIER"], ts_pos))
-                pos += len(id_prefix)
+            # Parcurgerea tokenului continua peste bucati, fara a o relua de la inceput
+            state = compiled.start
+            scan = pos
+            accept, accept_state = -1, DEAD_STATE
+            while True:
+                limit = min(len(buffer), pos + max_lookahead)
+                state, end, end_state, scan = compiled.advance(
+                    buffer, scan, state, limit
+                )
+                if end >= 0:
+                    accept, accept_state = end, end_state
+                if state == DEAD_STATE or eof or scan - pos >= max_lookahead:
+                    break
+                shift = refill(pos)
+                pos -= shift
+                scan -= shift
+                if accept >= 0:
+                    accept -= shift
+
+            column = base + pos - line_start + 1
+            if accept >= 0:
+                value = buffer[pos:accept]
+                yield self.make_token(compiled.tags[accept_state], value, line, column)
+                pos = accept
                 continue
 
-            # Daca nu am potrivit nimic, avem o eroare lexicala
-            error_msg = f"Eroare lexicala la linia {line}, coloana {column}: caracter invalid '{text[pos]}'"
-            self.errors.append(error_msg)
-            pos += 1
+            if self.error_limit_reached():
+                return
+            limit = pos + max_lookahead
+            end = self.error_end(buffer, pos, limit)
+            # In modul "run" secventa invalida poate continua in bucata urmatoare
+            while self.error_mode == "run" and end == len(buffer) < limit and not eof:
+                shift = refill(pos)
+                pos -= shift
+                limit -= shift
+                end = self.skip_invalid(buffer, end - shift, limit)
+            self.report_error(line, column, buffer[pos:end])
+            pos = end
 
-        return tokens, self.symbol_table, self.errors
+    def format_fip(self) -> List[str]:
+        """Randurile FIP (cod token, pozitie TS), fiecare terminat cu newline"""
+        return [
+            f"{code:<15} {str(ts_pos) if ts_pos >= 0 else '-':<15}\n"
+            for code, ts_pos in self.fip
+        ]
+
+    def format_symbol_table(self) -> List[str]:
+        """Randurile TS ('pozitie: simbol'), fiecare terminat cu newline"""
+        if not len(self.symbol_table):
+            return ["(vida)\n"]
+        return [str(self.symbol_table) + "\n"]
+
+    def format_tokens(self, tokens: Union[TokenStore, List[Token]]) -> List[str]:
+        """Randurile listei de tokeni (tip, valoare, linie:coloana)"""
+        if isinstance(tokens, TokenStore):
+            # Direct din coloane, fara obiecte Token intermediare
+            text = tokens.text
+            names = [f"{name:<20} " for name in TOKEN_TYPES]
+            return [
+                f"{names[kind]}{text[start : start + length]:<30} {line}:{column}\n"
+                for kind, start, length, line, column in zip(
+                    tokens.types,
+                    tokens.starts,
+                    tokens.lengths,
+                    tokens.lines,
+                    tokens.columns,
+                )
+            ]
+        return [
+            f"{token.token_type:<20} {token.value:<30} {token.line}:{token.column}\n"
+            for token in tokens
+        ]
+
+    def format_errors(self) -> List[str]:
+        """Randurile cu erorile lexicale (si nota de oprire, daca analiza s-a oprit)"""
+        lines = [error + "\n" for error in self.errors]
+        if self.aborted:
+            lines.append(
+                f"Analiza oprita: s-a depasit limita de {self.max_errors} "
+                "erori lexicale\n"
+            )
+        return lines
 
     def print_fip(self):
         """Afiseaza FIP (Forma Interna a Programului)"""
-        print("\n=== FIP (Forma Interna a Programului) ===")
-        print(f"{'Cod Token':<15} {'Pozitie TS':<15}")
-        print("-" * 30)
-        for code, ts_pos in self.fip:
-            ts_str = str(ts_pos) if ts_pos >= 0 else "-"
-            print(f"{code:<15} {ts_str:<15}")
+        lines = ["\n=== FIP (Forma Interna a Programului) ===\n"]
+        lines.append(f"{'Cod Token':<15} {'Pozitie TS':<15}\n")
+        lines.append("-" * 30 + "\n")
+        lines += self.format_fip()
+        sys.stdout.write("".join(lines))
 
     def print_symbol_table(self):
         """Afiseaza tabela de simboluri"""
-        print("\n=== Tabela de Simboluri (TS) ===")
-        print(f"{'Pozitie':<10} {'Simbol':<30}")
-        print("-" * 40)
-        if self.symbol_table.root is not None:
-            print(self.symbol_table)
-        else:
-            print("(vida)")
+        lines = ["\n=== Tabela de Simboluri (TS) ===\n"]
+        lines.append(f"{'Pozitie':<10} {'Simbol':<30}\n")
+        lines.append("-" * 40 + "\n")
+        lines += self.format_symbol_table()
+        sys.stdout.write("".join(lines))
 
     def print_errors(self):
         """Afiseaza erorile lexicale"""
-        if self.errors:
-            print("\n=== ERORI LEXICALE ===")
-            for error in self.errors:
-                print(f"  {error}")
+        if self.errors or self.aborted:
+            lines = ["\n=== ERORI LEXICALE ===\n"]
+            lines += [f"  {line}" for line in self.format_errors()]
+            sys.stdout.write("".join(lines))
         else:
             print("\n=== Analiza lexicala reusita (fara erori) ===")
 
-    def print_tokens(self, tokens: List[Token]):
+    def print_tokens(self, tokens: Union[TokenStore, List[Token]]):
         """Afiseaza lista de tokeni"""
-        print("\n=== Lista de Tokeni ===")
-        print(f"{'Tip':<20} {'Valoare':<30} {'Linie:Coloana':<15}")
-        print("-" * 65)
-        for token in tokens:
-            print(
-                f"{token.token_type:<20} {token.value:<30} {token.line}:{token.column}"
-            )
+        lines = ["\n=== Lista de Tokeni ===\n"]
+        lines.append(f"{'Tip':<20} {'Valoare':<30} {'Linie:Coloana':<15}\n")
+        lines.append("-" * 65 + "\n")
+        lines += self.format_tokens(tokens)
+        sys.stdout.write("".join(lines))
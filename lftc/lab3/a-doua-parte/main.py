@@ -18,7 +18,9 @@ Observatii:
 """
 
 import sys
+from typing import List
 
+from binary_output import save_binary
 from lexical_analyzer import LexicalAnalyzer
 
 
@@ -37,27 +39,47 @@ def print_menu():
 def analyze_file(analyzer: LexicalAnalyzer):
     """Analizeaza continutul unui fisier"""
     file_path = input("Introduceti calea fisierului: ").strip()
+    analyze_path(analyzer, file_path)
+
+
+def analyze_path(
+    analyzer: LexicalAnalyzer,
+    file_path: str,
+    console: bool = True,
+    binary: bool = False,
+):
+    """
+    Analizeaza un fisier si salveaza rezultatele. Cu console=False nu se mai
+    afiseaza continutul si rezultatele, doar un rezumat (pentru fisiere mari).
+    """
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             text = f.read()
 
         print(f"\n>>> Analizam fisierul: {file_path}")
-        print(f">>> Continut ({len(text)} caractere):")
-        print("-" * 60)
-        print(text)
-        print("-" * 60)
+        if console:
+            print(f">>> Continut ({len(text)} caractere):")
+            print("-" * 60)
+            print(text)
+            print("-" * 60)
 
         tokens, symbol_table, errors = analyzer.analyze(text)
 
         # Afisam rezultatele
-        analyzer.print_tokens(tokens)
-        analyzer.print_fip()
-        analyzer.print_symbol_table()
-        analyzer.print_errors()
+        if console:
+            analyzer.print_tokens(tokens)
+            analyzer.print_fip()
+            analyzer.print_symbol_table()
+            analyzer.print_errors()
+        else:
+            print(
+                f">>> {len(text)} caractere, {len(tokens)} tokeni, "
+                f"{len(symbol_table)} simboluri, {len(errors)} erori"
+            )
 
         # Salvam rezultatele in fisiere
         base_name = file_path.rsplit(".", 1)[0]
-        save_results(base_name, analyzer, tokens)
+        save_results(base_name, analyzer, tokens, verbose=console, binary=binary)
 
     except FileNotFoundError:
         print(f"Eroare: Fisierul '{file_path}' nu a fost gasit!")
@@ -91,6 +113,12 @@ def analyze_keyboard(analyzer: LexicalAnalyzer):
     analyzer.print_errors()
 
 
+def format_counts(analyzer: LexicalAnalyzer, name: str) -> str:
+    """Formateaza numarul de stari inainte -> dupa minimizare"""
+    before, after = analyzer.state_counts[name]
+    return f"{before} -> {after}"
+
+
 def show_automata_info(analyzer: LexicalAnalyzer):
     """Afiseaza informatii despre automatele folosite"""
     print("\n=== INFORMATII DESPRE AUTOMATE ===\n")
@@ -102,6 +130,10 @@ def show_automata_info(analyzer: LexicalAnalyzer):
     print(
         f"   - Determinist: {'DA' if analyzer.afd_identifier.is_deterministic() else 'NU'}"
     )
+    print(
+        "   - Stari inainte/dupa minimizare: "
+        f"{format_counts(analyzer, 'afd_identifier.txt')}"
+    )
     print(f"   - Pattern: [a-zA-Z_][a-zA-Z0-9_]*")
 
     print("\n2. AFD pentru CONSTANTE INTREGI:")
@@ -111,6 +143,10 @@ def show_automata_info(analyzer: LexicalAnalyzer):
     print(
         f"   - Determinist: {'DA' if analyzer.afd_integer.is_deterministic() else 'NU'}"
     )
+    print(
+        "   - Stari inainte/dupa minimizare: "
+        f"{format_counts(analyzer, 'afd_integer.txt')}"
+    )
     print(f"   - Accepta: literale intregi C/C++ (decimal, octal, hex, binar)")
     print(f"   - Sursa: https://en.cppreference.com/w/cpp/language/integer_literal")
 
@@ -119,10 +155,18 @@ def show_automata_info(analyzer: LexicalAnalyzer):
     print(f"   - Stare initiala: {analyzer.afd_real.initial_state}")
     print(f"   - Stari finale: {analyzer.afd_real.pretty_finals()}")
     print(f"   - Determinist: {'DA' if analyzer.afd_real.is_deterministic() else 'NU'}")
+    print(
+        f"   - Stari inainte/dupa minimizare: {format_counts(analyzer, 'afd_real.txt')}"
+    )
     print(f"   - Pattern: [0-9]+\\.[0-9]+([eE][+-]?[0-9]+)?[fFlL]?")
 
-    print("\n4. CUVINTE CHEIE:")
+    print("\n4. CUVINTE CHEIE (din keywords.txt):")
     print(f"   {', '.join(sorted(analyzer.keywords))}")
+    print(
+        "   - Recunoscute in AFD-ul identificatorilor: "
+        f"{len(analyzer.afd_word.states)} stari"
+    )
+    print(f"   - Stari inainte/dupa minimizare: {format_counts(analyzer, 'cuvinte')}")
 
     print("\n5. OPERATORI:")
     print(f"   {', '.join(sorted(analyzer.operators))}")
@@ -130,60 +174,96 @@ def show_automata_info(analyzer: LexicalAnalyzer):
     print("\n6. DELIMITATORI:")
     print(f"   {', '.join(sorted(analyzer.delimiters))}")
 
-
-def save_results(base_name: str, analyzer: LexicalAnalyzer, tokens):
-    """Salveaza rezultatele in fisiere"""
+    print("\n7. AFD COMBINAT (toate clasele de tokeni):")
+    print(f"   - Numar stari: {len(analyzer.afd_combined.states)}")
+    print(f"   - Stari inainte/dupa minimizare: {format_counts(analyzer, 'combinat')}")
+    print(f"   - Numar stari finale: {len(analyzer.afd_combined.final_states)}")
+    print(
+        f"   - Clase de simboluri: {analyzer.afd_combined.compile().num_classes}"
+        f" (alfabet: {len(analyzer.afd_combined.alphabet)} simboluri)"
+    )
+    print(f"   - Folosit la analiza: {'DA' if analyzer.combined else 'NU'}")
+
+
+def write_lines(path: str, header: List[str], lines: List[str]):
+    """Scrie fisierul dintr-o singura operatie (antet + randuri)"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(header + lines))
+
+
+def save_results(
+    base_name: str,
+    analyzer: LexicalAnalyzer,
+    tokens,
+    verbose: bool = True,
+    binary: bool = False,
+):
+    """
+    Salveaza rezultatele in fisiere (verbose=False nu mai afiseaza caile).
+    Cu binary=True se scrie si FIP-ul + TS-ul in format binar (_fip.bin).
+    """
     # Salvam FIP
     fip_file = f"{base_name}_fip.txt"
-    with open(fip_file, "w", encoding="utf-8") as f:
-        f.write("FIP (Forma Interna a Programului)\n")
-        f.write("=" * 40 + "\n")
-        f.write(f"{'Cod Token':<15} {'Pozitie TS':<15}\n")
-        f.write("-" * 30 + "\n")
-        for code, ts_pos in analyzer.fip:
-            ts_str = str(ts_pos) if ts_pos >= 0 else "-"
-            f.write(f"{code:<15} {ts_str:<15}\n")
-    print(f"\n>>> FIP salvat in: {fip_file}")
+    header = [
+        "FIP (Forma Interna a Programului)\n",
+        "=" * 40 + "\n",
+        f"{'Cod Token':<15} {'Pozitie TS':<15}\n",
+        "-" * 30 + "\n",
+    ]
+    write_lines(fip_file, header, analyzer.format_fip())
+    if verbose:
+        print(f"\n>>> FIP salvat in: {fip_file}")
 
     # Salvam TS
     ts_file = f"{base_name}_ts.txt"
-    with open(ts_file, "w", encoding="utf-8") as f:
-        f.write("Tabela de Simboluri (TS)\n")
-        f.write("=" * 40 + "\n")
-        f.write(f"{'Pozitie':<10} {'Simbol':<30}\n")
-        f.write("-" * 40 + "\n")
-        if analyzer.symbol_table.root is not None:
-            f.write(str(analyzer.symbol_table) + "\n")
-        else:
-            f.write("(vida)\n")
-    print(f">>> TS salvata in: {ts_file}")
+    header = [
+        "Tabela de Simboluri (TS)\n",
+        "=" * 40 + "\n",
+        f"{'Pozitie':<10} {'Simbol':<30}\n",
+        "-" * 40 + "\n",
+    ]
+    write_lines(ts_file, header, analyzer.format_symbol_table())
+    if verbose:
+        print(f">>> TS salvata in: {ts_file}")
 
     # Salvam tokenii
     tokens_file = f"{base_name}_tokens.txt"
-    with open(tokens_file, "w", encoding="utf-8") as f:
-        f.write("Lista de Tokeni\n")
-        f.write("=" * 65 + "\n")
-        f.write(f"{'Tip':<20} {'Valoare':<30} {'Linie:Coloana':<15}\n")
-        f.write("-" * 65 + "\n")
-        for token in tokens:
-            f.write(
-                f"{token.token_type:<20} {token.value:<30} {token.line}:{token.column}\n"
-            )
-    print(f">>> Tokeni salvati in: {tokens_file}")
+    header = [
+        "Lista de Tokeni\n",
+        "=" * 65 + "\n",
+        f"{'Tip':<20} {'Valoare':<30} {'Linie:Coloana':<15}\n",
+        "-" * 65 + "\n",
+    ]
+    write_lines(tokens_file, header, analyzer.format_tokens(tokens))
+    if verbose:
+        print(f">>> Tokeni salvati in: {tokens_file}")
+
+    # Salvam FIP-ul si TS-ul in format binar, pentru etapele urmatoare
+    if binary:
+        binary_file = f"{base_name}_fip.bin"
+        save_binary(binary_file, tokens, analyzer.symbol_table)
+        if verbose:
+            print(f">>> FIP/TS binar salvat in: {binary_file}")
 
     # Salvam erorile (daca exista)
-    if analyzer.errors:
+    if analyzer.errors or analyzer.aborted:
         errors_file = f"{base_name}_errors.txt"
-        with open(errors_file, "w", encoding="utf-8") as f:
-            f.write("Erori Lexicale\n")
-            f.write("=" * 60 + "\n")
-            for error in analyzer.errors:
-                f.write(error + "\n")
-        print(f">>> Erori salvate in: {errors_file}")
+        header = ["Erori Lexicale\n", "=" * 60 + "\n"]
+        write_lines(errors_file, header, analyzer.format_errors())
+        if verbose:
+            print(f">>> Erori salvate in: {errors_file}")
 
 
 def main():
-    """Functia principala"""
+    """
+    Functia principala. Fara argumente porneste meniul interactiv; altfel
+    analizeaza fisierele date: python3 main.py fisier... [--no-console] [--binary]
+    """
+    args = sys.argv[1:]
+    console = "--no-console" not in args
+    binary = "--binary" in args
+    paths = [arg for arg in args if arg not in ("--no-console", "--binary")]
+
     print("\n" + "=" * 60)
     print("Incarcare automate finite...")
     print("=" * 60)
@@ -193,14 +273,27 @@ def main():
         print("✓ AFD pentru identificatori incarcata")
         print("✓ AFD pentru constante intregi incarcata")
         print("✓ AFD pentru constante reale incarcata")
+        print("✓ AFD pentru siruri si caractere incarcate")
+        print("✓ Cuvinte cheie incarcate (keywords.txt)")
+        print("✓ AFD combinat construit")
     except Exception as e:
         print(f"\nEroare la incarcarea automatelor: {e}")
         print("\nAsigurati-va ca fisierele urmatoare exista:")
         print("  - afd_identifier.txt")
         print("  - afd_integer.txt")
         print("  - afd_real.txt")
+        print("  - afd_string.txt")
+        print("  - afd_char.txt")
+        print("  - keywords.txt")
+        print("  - operators.txt")
+        print("  - delimiters.txt")
         sys.exit(1)
 
+    if paths:
+        for path in paths:
+            analyze_path(analyzer, path, console, binary)
+        return
+
     while True:
         print_menu()
         choice = input("\nAlege optiunea: ").strip()
@@ -0,0 +1,144 @@
+"""
+Teste de regresie pentru analizorul lexical si fisierele lui binare
+
+Rulare (din acest director):
+    python3 -m unittest test_regressions
+"""
+
+import io
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+from automaton import Automaton, CompiledDFA
+from automaton_cache import load_cache
+from binary_output import BinaryOutput, save_binary
+from lexical_analyzer import LexicalAnalyzer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SAMPLE = 'int x = 10;\nfloat y = x * 2.5e3;\nwrite("ok");\n'
+
+
+def analyze(analyzer: LexicalAnalyzer, text: str):
+    """Tokenii (ca text) si erorile, comparabile intre analizoare"""
+    tokens, _, errors = analyzer.analyze(text)
+    return [repr(token) for token in tokens], list(errors)
+
+
+def setUpModule():
+    # Fisierele automatelor sunt cautate relativ la directorul curent
+    global _old_cwd
+    _old_cwd = os.getcwd()
+    os.chdir(HERE)
+
+
+def tearDownModule():
+    os.chdir(_old_cwd)
+
+
+class CorruptCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache = os.path.join(self.tmp, "cache.bin")
+        self.expected = analyze(LexicalAnalyzer(cache_path=None), SAMPLE)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def corrupt(self, offset: int, value: int):
+        with open(self.cache, "r+b") as f:
+            f.seek(offset)
+            f.write(struct.pack("<i", value))
+
+    def check_rebuilt(self):
+        analyzer = LexicalAnalyzer(cache_path=self.cache)
+        self.assertEqual(analyze(analyzer, SAMPLE), self.expected)
+        self.assertIsNotNone(load_cache(self.cache, analyzer.cache_key))
+
+    def test_bad_table_entry_rebuilds(self):
+        # Ultima intrare din fisier se termina cu tabelul ultimului automat
+        LexicalAnalyzer(cache_path=self.cache)
+        size = os.path.getsize(self.cache)
+        for value in (1 << 30, -1):
+            self.corrupt(size - 4, value)
+            self.check_rebuilt()
+
+    def test_from_buffer_rejects_bad_data(self):
+        compiled = Automaton.from_words(["ab", "ac"]).compile()
+        data = compiled.to_bytes()
+        CompiledDFA.from_buffer(data)
+        bad_start = data[:8] + struct.pack("<I", len(compiled.state_names)) + data[12:]
+        bad_table = data[:-4] + struct.pack("<i", len(compiled.state_names))
+        for buffer in (bad_start, bad_table):
+            with self.assertRaises(ValueError):
+                CompiledDFA.from_buffer(buffer)
+
+
+class StreamingErrorsTest(unittest.TestCase):
+    # Secvente invalide lungi, care traverseaza granitele dintre bucati
+    TEXT = (
+        "int a = 1; @@@@@@@@@@ b = 2;\n"
+        "#$ c = 'x'; ` d\n"
+        "e = 3.5 $$$$$$$$$$$$$$$$$$$$$$$$$$$$$$ f;\n"
+        "@ g # h\n"
+    )
+
+    def test_iter_tokens_matches_analyze(self):
+        for error_mode in ("char", "run"):
+            for max_errors in (None, 0, 1, 3):
+                with self.subTest(error_mode=error_mode, max_errors=max_errors):
+                    analyzer = LexicalAnalyzer(
+                        error_mode=error_mode, max_errors=max_errors
+                    )
+                    tokens, _, errors = analyzer.analyze(self.TEXT)
+                    expected = (
+                        [repr(token) for token in tokens],
+                        list(analyzer.fip),
+                        list(errors),
+                        analyzer.aborted,
+                    )
+                    for chunk_size in (3, 7, 1 << 16):
+                        pairs = list(
+                            analyzer.iter_tokens(
+                                io.StringIO(self.TEXT), chunk_size=chunk_size
+                            )
+                        )
+                        actual = (
+                            [repr(token) for token, _ in pairs],
+                            [entry for _, entry in pairs],
+                            analyzer.errors,
+                            analyzer.aborted,
+                        )
+                        self.assertEqual(actual, expected)
+
+
+class BinaryOutputTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "prog_fip.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_empty_or_truncated_file(self):
+        analyzer = LexicalAnalyzer()
+        tokens, symbol_table, _ = analyzer.analyze(SAMPLE)
+        save_binary(self.path, tokens, symbol_table)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        with BinaryOutput(self.path) as fip:
+            self.assertEqual(list(fip), list(analyzer.fip))
+
+        for size in range(len(data)):
+            with open(self.path, "wb") as f:
+                f.write(data[:size])
+            with self.subTest(size=size):
+                with self.assertRaisesRegex(ValueError, "trunchiat"):
+                    BinaryOutput(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Verifica automatele folosite de analizor fata de sursele lor
+
+- fiecare AFD minimizat (sau incarcat din cache) accepta acelasi limbaj ca
+  fisierul afd_*.txt din care provine;
+- in fiecare automat reunit (cuvinte, operatori, combinat), starile finale cu
+  eticheta T accepta exact limbajul componentei T fara limbajele componentelor
+  cu prioritate mai mare.
+
+Pentru fiecare diferenta se afiseaza o secventa care o demonstreaza. Codul de
+iesire este 1 daca exista diferente (util in CI).
+
+Rulare:
+    python3 verify_automata.py [--no-cache]
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from automaton import Automaton, LazyDFA
+from lexical_analyzer import (
+    AUTOMATON_FILES,
+    CACHE_FILE,
+    MERGED_AUTOMATA,
+    LexicalAnalyzer,
+)
+
+
+def tag_language(automaton: Automaton, tag: str) -> Automaton:
+    """Acelasi automat, cu finale doar starile etichetate cu 'tag'"""
+    finals = {
+        state for state in automaton.final_states if automaton.tags.get(state) == tag
+    }
+    return Automaton(
+        automaton.states,
+        automaton.alphabet,
+        automaton.transitions,
+        automaton.initial_state,
+        finals,
+    )
+
+
+def check_sources(analyzer: LexicalAnalyzer) -> List[str]:
+    """Automatele analizorului fata de fisierele afd_*.txt"""
+    problems = []
+    for attr, path in AUTOMATON_FILES.items():
+        word = getattr(analyzer, attr).distinguishing_word(Automaton.from_file(path))
+        if word is not None:
+            problems.append(f"{attr} difera de {path}: secventa {word!r}")
+    return problems
+
+
+def check_merged(analyzer: LexicalAnalyzer) -> List[str]:
+    """Limbajul fiecarei etichete din automatele reunite"""
+    problems = []
+    components = analyzer.merged_components()
+    for attr in MERGED_AUTOMATA:
+        merged = getattr(analyzer, attr)
+        earlier: Optional[LazyDFA] = None
+        for tag, component in components[attr]:
+            expected = component.lazy() if earlier is None else component - earlier
+            word = tag_language(merged, tag).distinguishing_word(expected)
+            if word is not None:
+                problems.append(f"{attr}, eticheta {tag}: secventa {word!r}")
+            earlier = component.lazy() if earlier is None else earlier | component
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Verifica echivalenta automatelor analizorului"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="construieste automatele din surse, fara cache",
+    )
+    args = parser.parse_args()
+
+    analyzer = LexicalAnalyzer(cache_path=None if args.no_cache else CACHE_FILE)
+    problems = check_sources(analyzer) + check_merged(analyzer)
+    for problem in problems:
+        print(f"  {problem}")
+    if problems:
+        print(f"{len(problems)} diferente gasite")
+        sys.exit(1)
+    print(
+        f"OK: {len(AUTOMATON_FILES)} automate si "
+        f"{len(MERGED_AUTOMATA)} automate reunite verificate"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-from typing import Dict, Set, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Set, Tuple, Optional
 import re
 
 EPSILON = "epsilon"
@@ -21,6 +22,8 @@ class Automaton:
             self.transitions[(src, sym)] = set(dests)
         self.initial_state = initial_state
         self.final_states = set(final_states)
+        # Tabelul DFA pentru verificarile pe loturi, construit la prima folosire
+        self._table: Optional[Dict[Tuple[str, str], str]] = None
 
         # Basic validation
         if self.initial_state not in self.states:
@@ -226,6 +229,52 @@ class Automaton:
             return sequence[: last_accept_idx + 1]
         return ""
 
+    def _dfa_table(self) -> Dict[Tuple[str, str], str]:
+        """Doar pentru DFA. Tranzitiile ca dictionar (stare, simbol) -> stare urmatoare."""
+        if self._table is None:
+            if not self.is_deterministic():
+                raise ValueError("Automatul nu este determinist.")
+            self._table = {
+                key: next(iter(dests)) for key, dests in self.transitions.items() if dests
+            }
+        return self._table
+
+    def check_many(
+        self, sequences: Iterable[str], cache_size: int = 0
+    ) -> Iterator[Tuple[bool, str]]:
+        """
+        Pentru fiecare secventa: (este acceptata, cel mai lung prefix acceptat),
+        dintr-o singura parcurgere. Secventele sunt consumate pe rand, deci pot
+        veni direct dintr-un fisier; determinismul se verifica imediat. Cu
+        cache_size > 0 rezultatele pentru ultimele secvente distincte sunt
+        memorate (util pentru duplicate).
+        """
+        table = self._dfa_table()
+        initial, finals = self.initial_state, self.final_states
+
+        def check(sequence: str) -> Tuple[bool, str]:
+            current = initial
+            length = 0
+            for idx, ch in enumerate(sequence):
+                current = table.get((current, ch))
+                if current is None:
+                    return False, sequence[:length]
+                if current in finals:
+                    length = idx + 1
+            return current in finals, sequence[:length]
+
+        if cache_size:
+            check = lru_cache(maxsize=cache_size)(check)
+        return map(check, sequences)
+
+    def accepts_many(self, sequences: Iterable[str], cache_size: int = 0) -> Iterator[bool]:
+        """Ca accepts, pentru mai multe secvente (vezi check_many)."""
+        return (ok for ok, _ in self.check_many(sequences, cache_size))
+
+    def longest_prefixes(self, sequences: Iterable[str], cache_size: int = 0) -> Iterator[str]:
+        """Ca longest_accepted_prefix, pentru mai multe secvente (vezi check_many)."""
+        return (prefix for _, prefix in self.check_many(sequences, cache_size))
+
     def pretty_states(self) -> str:
         return "{" + ", ".join(sorted(self.states)) + "}"
 
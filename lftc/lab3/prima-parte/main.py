@@ -1,6 +1,10 @@
 import sys
+from itertools import tee
 from automaton import Automaton
 
+# Cate secvente distincte recente memoreaza verificarea din fisier (optiunea 9)
+SEQUENCE_CACHE = 4096
+
 MENU = """
 Meniu:
   1. Afișează multimea starilor
@@ -11,6 +15,7 @@ Meniu:
   6. Determina cel mai lung prefix acceptat (AFD)
   7. Citeste automat din fisier
   8. Citeste automat de la tastatura (interactiv)
+  9. Verifica secventele dintr-un fisier (cate una pe linie)
   0. Iesire
 """
 
@@ -73,6 +78,25 @@ def main() -> None:
                     print("Niciun prefix acceptat.")
             except Exception as e:
                 print(f"Eroare: {e}")
+        elif choice == "9":
+            path = input("Introduceti calea fișierului cu secvente: ").strip()
+            try:
+                out_path = path.rsplit(".", 1)[0] + "_rezultate.txt"
+                total = accepted = 0
+                # Fisierul este citit si rezultatele scrise linie cu linie
+                with open(path, "r", encoding="utf-8") as src:
+                    lines = (line.rstrip("\r\n") for line in src)
+                    sequences, to_check = tee(lines)
+                    results = af.check_many(to_check, cache_size=SEQUENCE_CACHE)
+                    with open(out_path, "w", encoding="utf-8") as out:
+                        for seq, (ok, prefix) in zip(sequences, results):
+                            out.write(f"{seq}\t{'DA' if ok else 'NU'}\t{prefix}\n")
+                            total += 1
+                            accepted += ok
+                print(f"Secvente acceptate: {accepted} din {total}.")
+                print(f"Rezultatele (secventa, acceptata, cel mai lung prefix) in: {out_path}")
+            except Exception as e:
+                print(f"Eroare: {e}")
         else:
             print("Optiune invalida. Reincercati.")
 